@@ -97,8 +97,13 @@ def create_default_config():
     
     logger.info(f"默认配置文件已创建并加密: {config_path}")
 
+# 上次写入的配置：(路径, 明文内容, 写入后的 mtime_ns, 写入后的文件大小)
+_last_saved = None
+
+
 def save_config(cfg):
-    """保存并加密配置文件"""
+    """保存并加密配置文件（内容与上次写入相同且文件未被改动时跳过写入）"""
+    global _last_saved
     config_path = str(get_config_path())
     
     # 将配置写入字符串流
@@ -106,12 +111,26 @@ def save_config(cfg):
     cfg.write(output)
     content = output.getvalue()
     
+    # DPAPI 每次加密结果都不同，只能按明文比较；同时确认文件自上次写入后未被改动
+    if _last_saved is not None and _last_saved[0] == config_path and _last_saved[1] == content:
+        try:
+            st = os.stat(config_path)
+            if (st.st_mtime_ns, st.st_size) == _last_saved[2:]:
+                logging.getLogger(__name__).debug("配置未变化，跳过写入")
+                return
+        except OSError:
+            pass
+    
     # 使用 DPAPI 加密
     encrypted_data = dpapi.encrypt(content)
     
-    # 写入二进制文件
-    with open(config_path, 'wb') as f:
+    # 先写临时文件再原子替换，避免写入中断导致配置文件损坏
+    tmp_path = config_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
         f.write(encrypted_data)
+    os.replace(tmp_path, config_path)
+    st = os.stat(config_path)
+    _last_saved = (config_path, content, st.st_mtime_ns, st.st_size)
 
 
 def get_plaintext_config_from_encrypted():
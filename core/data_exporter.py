@@ -10,6 +10,14 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+# 可选：orjson 序列化更快，未安装时回退到标准库 json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 # 导入日志模块
 try:
     from log import get_logger
@@ -43,6 +51,18 @@ except ImportError:
 APPDATA_DIR = Path.home() / "AppData" / "Local" / "Capture_Push"
 
 
+def _write_json(output_file: Path, data: Dict[str, Any]):
+    """将数据一次性序列化后整体写入文件（json.dump 会按片段多次调用 write）"""
+    if ORJSON_AVAILABLE:
+        # orjson 直接输出 UTF-8 字节，非 ASCII 字符默认不转义
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
 def get_current_school_code() -> str:
     """获取当前院校代码"""
     try:
@@ -112,8 +132,7 @@ def export_full_data(output_path: Optional[str] = None) -> Dict[str, Any]:
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, ensure_ascii=False, indent=2)
+            _write_json(output_file, export_data)
             
             logger.info(f"数据已导出到: {output_file}")
             return {"status": "success", "file_path": str(output_file)}
@@ -170,8 +189,7 @@ def export_schedule_only(output_path: Optional[str] = None) -> Dict[str, Any]:
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, ensure_ascii=False, indent=2)
+            _write_json(output_file, export_data)
             
             logger.info(f"课表数据已导出到: {output_file}")
             return {"status": "success", "file_path": str(output_file)}
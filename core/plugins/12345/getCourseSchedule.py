@@ -168,7 +168,10 @@ def update_timestamp():
 
 # ===== 8. 获取课表 HTML =====
 def get_schedule_html(session, force_update=False):
-    """获取课表HTML，支持循环检测。所有文件存储在 AppData 目录。"""
+    """获取课表HTML，支持循环检测。所有文件存储在 AppData 目录。
+    
+    本地缓存以 UTF-8 字节形式返回（交给解析器直接解码），网络获取时返回文本。
+    """
     cache_file = APPDATA_DIR / "schedule.html"
     
     logger.info(f"get_schedule_html 被调用, force_update={force_update}, RUN_MODE={RUN_MODE}")
@@ -180,8 +183,7 @@ def get_schedule_html(session, force_update=False):
         if RUN_MODE == 'DEV':
             logger.info(f"[DEV 模式] 从 AppData 文件读取课表数据: {cache_file}")
             try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    return f.read()
+                return cache_file.read_bytes()
             except FileNotFoundError:
                 logger.error(f"未找到 {cache_file}，请先在 BUILD 模式运行生成")
                 return None
@@ -193,8 +195,7 @@ def get_schedule_html(session, force_update=False):
         if not should_update_schedule():
             logger.info("未达到更新间隔，将使用本地缓存的课表数据")
             try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    return f.read()
+                return cache_file.read_bytes()
             except Exception as e:
                 logger.warning(f"读取本地缓存失败: {e}，将回退到网络获取")
     
@@ -231,7 +232,11 @@ def get_schedule_html(session, force_update=False):
 # ===== 9. 解析青果课表 =====
 def parse_schedule(html):
     logger.info("开始解析青果系统课表结构")
-    soup = BeautifulSoup(html, "html.parser")
+    if isinstance(html, bytes):
+        # 缓存文件固定为 UTF-8，直接指定编码，省去编码探测
+        soup = BeautifulSoup(html, "html.parser", from_encoding="utf-8")
+    else:
+        soup = BeautifulSoup(html, "html.parser")
     table = soup.find("table", id="timetable")
     if not table:
         logger.error("未找到 <table id='timetable'>")
@@ -11,6 +11,7 @@ import json
 import tempfile
 import hashlib
 import zipfile
+import threading
 from pathlib import Path
 import importlib.util
 from typing import Optional, Dict, Any
@@ -45,8 +46,24 @@ class PluginManager:
         # 当前版本文件
         self.version_file = self.plugins_dir / "current" / "version.txt"
         
-        # 插件索引缓存
+        # 插件索引缓存，及其对应本地索引文件的 (mtime_ns, size)，文件变化时失效
         self.plugins_index_cache = None
+        self._plugins_index_stamp = None
+        # 上次从远程获取插件索引时服务器返回的 ETag / Last-Modified
+        self._plugins_index_etag = None
+        self._plugins_index_last_modified = None
+        
+        # 已安装插件列表缓存，插件目录快照（目录及各插件子目录的修改时间）变化时失效
+        self._available_plugins_cache = None
+        self._available_plugins_key = None
+        self._available_plugins_lock = threading.Lock()
+        
+        # 本地插件版本缓存: {school_code: ((version.txt, __init__.py 的 mtime_ns), version)}
+        self._version_cache = {}
+        
+        # 已加载插件模块缓存: {school_code: (__init__.py 的 mtime_ns, module)}
+        self._loaded_plugins = {}
+        self._loaded_plugins_lock = threading.Lock()
         
         # 从配置文件加载插件设置
         from core.config_manager import load_config
@@ -70,7 +87,7 @@ class PluginManager:
     
     def _get_local_plugin_version(self, school_code: str) -> str:
         """
-        获取本地插件版本
+        获取本地插件版本（版本文件未变化时直接返回缓存结果）
         
         Args:
             school_code: 院校代码
@@ -78,9 +95,54 @@ class PluginManager:
         Returns:
             本地插件版本号，如果不存在则返回 '0.0.0'
         """
+        plugin_dir = self.plugins_dir / school_code
+        version_file = plugin_dir / "version.txt"
+        init_file = plugin_dir / "__init__.py"
+        stamp = (self._get_file_mtime_ns(version_file), self._get_file_mtime_ns(init_file))
+        cached = self._version_cache.get(school_code)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        version = self._read_local_plugin_version(school_code, version_file, init_file)
+        self._version_cache[school_code] = (stamp, version)
+        return version
+    
+    def get_all_local_versions(self) -> Dict[str, str]:
+        """
+        一次遍历插件目录获取所有本地插件版本
+        
+        Returns:
+            院校代码到本地版本号的映射，不在其中的插件视为未安装（'0.0.0'）
+        """
+        versions = {}
+        try:
+            with os.scandir(self.plugins_dir) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        versions[entry.name] = self._get_local_plugin_version(entry.name)
+        except OSError as e:
+            self.logger.error(f"遍历插件目录失败: {e}")
+        return versions
+    
+    def invalidate_local_plugin_version(self, school_code: str):
+        """
+        清除指定插件的本地版本缓存（安装或卸载插件后调用）
+        """
+        self._version_cache.pop(school_code, None)
+    
+    @staticmethod
+    def _get_file_mtime_ns(path: Path) -> Optional[int]:
+        """获取文件修改时间，文件不存在时返回 None"""
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+    
+    def _read_local_plugin_version(self, school_code: str, version_file: Path, init_file: Path) -> str:
+        """
+        从 version.txt 或 __init__.py 读取本地插件版本
+        """
         self.logger.debug(f"获取本地插件版本: {school_code}")
         try:
-            version_file = self.plugins_dir / school_code / "version.txt"
             if version_file.exists():
                 version = version_file.read_text(encoding='utf-8').strip()
                 self.logger.debug(f"插件 {school_code} 的本地版本: {version}")
@@ -88,8 +150,6 @@ class PluginManager:
             else:
                 self.logger.debug(f"插件 {school_code} 未找到version.txt文件")
                 # 尝试从插件模块中获取版本信息
-                plugin_dir = self.plugins_dir / school_code
-                init_file = plugin_dir / "__init__.py"
                 if init_file.exists():
                     with open(init_file, 'r', encoding='utf-8') as f:
                         content = f.read()
@@ -117,16 +177,21 @@ class PluginManager:
             self.logger.info("开始更新插件索引文件...")
             self.logger.debug(f"尝试从URL获取插件索引: {self.plugins_index_url}")
             
-            # 尝试从远程获取插件索引
-            req = urllib.request.Request(
-                self.plugins_index_url,
-                headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'}
-            )
+            # 尝试从远程获取插件索引；已有缓存时带上条件请求头，索引未变化时服务器返回 304
+            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'}
+            if self.plugins_index_cache and self.plugins_index_file.exists():
+                if self._plugins_index_etag:
+                    headers['If-None-Match'] = self._plugins_index_etag
+                if self._plugins_index_last_modified:
+                    headers['If-Modified-Since'] = self._plugins_index_last_modified
+            req = urllib.request.Request(self.plugins_index_url, headers=headers)
             
             with urllib.request.urlopen(req, timeout=10) as response:
                 self.logger.debug(f"HTTP响应状态码: {response.getcode()}")
                 self.logger.debug(f"HTTP响应头部: {dict(response.headers)}")
                 index_data = json.loads(response.read().decode('utf-8'))
+                self._plugins_index_etag = response.headers.get('ETag')
+                self._plugins_index_last_modified = response.headers.get('Last-Modified')
                 self.logger.debug(f"成功解析远程插件索引，包含 {len(index_data) if isinstance(index_data, dict) else len(index_data) if isinstance(index_data, list) else 'unknown'} 个项目")
             
             # 保存到本地文件
@@ -134,11 +199,14 @@ class PluginManager:
                 json.dump(index_data, f, ensure_ascii=False, indent=2)
             
             # 更新缓存
-            self.plugins_index_cache = index_data
+            self._set_plugins_index_cache(index_data)
             self.logger.info(f"插件索引已更新并保存到: {self.plugins_index_file}")
             return True
             
         except urllib.error.HTTPError as e:
+            if e.code == 304 and self.plugins_index_cache:
+                self.logger.info("远程插件索引未变化，继续使用本地索引")
+                return True
             self.logger.error(f"HTTP错误访问插件索引文件: {e.code} - {e.reason}")
             self.logger.error(f"响应内容: {e.read().decode('utf-8') if e.read() else 'No response body'}")
             return False
@@ -164,7 +232,7 @@ class PluginManager:
                     json.dump(index_data, f, ensure_ascii=False, indent=2)
                 
                 # 更新缓存
-                self.plugins_index_cache = index_data
+                self._set_plugins_index_cache(index_data)
                 self.logger.info(f"插件索引已通过代理更新并保存到: {self.plugins_index_file}")
                 return True
                 
@@ -573,8 +641,8 @@ class PluginManager:
         try:
             self.logger.debug("开始获取插件索引")
             self.logger.debug(f"尝试使用的URL: {self.plugins_index_url}")
-            # 首先检查缓存
-            if self.plugins_index_cache:
+            # 首先检查缓存，本地索引文件未变化时直接复用已解析的结果
+            if self.plugins_index_cache and self._plugins_index_stamp == self._get_plugins_index_stamp():
                 self.logger.debug("使用缓存的插件索引")
                 return self.plugins_index_cache
             
@@ -583,7 +651,7 @@ class PluginManager:
             local_index = self.get_local_plugins_index()
             if local_index:
                 # 更新缓存
-                self.plugins_index_cache = local_index
+                self._set_plugins_index_cache(local_index)
                 self.logger.debug("成功从本地文件加载插件索引并更新缓存")
                 return local_index
             
@@ -619,7 +687,7 @@ class PluginManager:
             self.logger.debug(f"插件索引已保存到本地文件: {self.plugins_index_file}")
             
             # 更新缓存
-            self.plugins_index_cache = index_data
+            self._set_plugins_index_cache(index_data)
             self.logger.debug("成功从远程获取插件索引并保存到本地文件")
             return index_data
             
@@ -663,7 +731,7 @@ class PluginManager:
                     self.logger.debug(f"代理获取的插件索引已保存到本地文件: {self.plugins_index_file}")
                 
                 # 更新缓存
-                self.plugins_index_cache = index_data
+                self._set_plugins_index_cache(index_data)
                 self.logger.info("通过代理成功获取插件索引并保存到本地文件")
                 return index_data
                 
@@ -674,7 +742,7 @@ class PluginManager:
                 local_index = self.get_local_plugins_index()
                 if local_index:
                     self.logger.info("虽然远程获取失败，但仍可使用本地插件索引")
-                    self.plugins_index_cache = local_index
+                    self._set_plugins_index_cache(local_index)
                     return local_index
                 else:
                     self.logger.error("无法获取插件索引，本地也没有可用的索引文件")
@@ -715,7 +783,7 @@ class PluginManager:
                     self.logger.debug(f"代理获取的插件索引已保存到本地文件: {self.plugins_index_file}")
                 
                 # 更新缓存
-                self.plugins_index_cache = index_data
+                self._set_plugins_index_cache(index_data)
                 self.logger.info("通过代理成功获取插件索引并保存到本地文件")
                 return index_data
                 
@@ -726,7 +794,7 @@ class PluginManager:
                 local_index = self.get_local_plugins_index()
                 if local_index:
                     self.logger.info("虽然远程获取失败，但仍可使用本地插件索引")
-                    self.plugins_index_cache = local_index
+                    self._set_plugins_index_cache(local_index)
                     return local_index
                 else:
                     self.logger.error("无法获取插件索引，本地也没有可用的索引文件")
@@ -740,7 +808,7 @@ class PluginManager:
             local_index = self.get_local_plugins_index()
             if local_index:
                 self.logger.info("虽然远程JSON解析失败，但仍可使用本地插件索引")
-                self.plugins_index_cache = local_index
+                self._set_plugins_index_cache(local_index)
                 return local_index
             else:
                 self.logger.error("无法获取插件索引，本地也没有可用的索引文件")
@@ -752,17 +820,35 @@ class PluginManager:
             local_index = self.get_local_plugins_index()
             if local_index:
                 self.logger.info("虽然远程获取失败，但仍可使用本地插件索引")
-                self.plugins_index_cache = local_index
+                self._set_plugins_index_cache(local_index)
                 return local_index
             else:
                 self.logger.error("无法获取插件索引，本地也没有可用的索引文件")
                 return None
 
+    def _get_plugins_index_stamp(self):
+        """
+        获取本地插件索引文件的 (mtime_ns, size)，文件不存在时返回 None
+        """
+        try:
+            st = self.plugins_index_file.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _set_plugins_index_cache(self, index_data):
+        """
+        更新插件索引缓存，并记录当前本地索引文件的状态用于后续校验
+        """
+        self.plugins_index_cache = index_data
+        self._plugins_index_stamp = self._get_plugins_index_stamp()
+    
     def clear_plugins_index_cache(self):
         """
         清除插件索引缓存，强制下次获取时重新从网络加载
         """
         self.plugins_index_cache = None
+        self._plugins_index_stamp = None
         
     def force_refresh_plugins_index(self) -> bool:
         """
@@ -887,6 +973,50 @@ class PluginManager:
         self.logger.info(f"共找到 {len(plugins)} 个已安装插件")
         return plugins
 
+    def get_plugins_snapshot_key(self) -> tuple:
+        """
+        获取插件目录和内置插件目录的快照键（安装/卸载/更新插件会改变目录或子目录的修改时间）
+        
+        Returns:
+            每个目录对应 (目录 mtime_ns, ((子目录名, mtime_ns), ...))，目录不存在时对应项为 None
+        """
+        key = []
+        for directory in (self.plugins_dir, Path(__file__).parent / "school"):
+            try:
+                dir_mtime = directory.stat().st_mtime_ns
+                with os.scandir(directory) as it:
+                    entries = sorted(
+                        (entry.name, entry.stat().st_mtime_ns)
+                        for entry in it if entry.is_dir()
+                    )
+                key.append((dir_mtime, tuple(entries)))
+            except OSError:
+                key.append(None)
+        return tuple(key)
+
+    def get_available_plugins_cached(self) -> Dict[str, str]:
+        """
+        获取已安装插件列表，插件目录快照未变化时复用上次扫描结果
+        （get_available_plugins 需要执行每个插件的 __init__.py，开销较大）
+        
+        Returns:
+            院校代码到院校名称的映射（副本，可自由修改）
+        """
+        with self._available_plugins_lock:
+            key = self.get_plugins_snapshot_key()
+            if self._available_plugins_cache is None or key != self._available_plugins_key:
+                self._available_plugins_cache = self.get_available_plugins()
+                self._available_plugins_key = key
+            return dict(self._available_plugins_cache)
+
+    def clear_available_plugins_cache(self):
+        """
+        清除已安装插件列表缓存，下次获取时重新扫描插件目录
+        """
+        with self._available_plugins_lock:
+            self._available_plugins_cache = None
+            self._available_plugins_key = None
+
     def get_uninstalled_plugins(self) -> Dict[str, str]:
         """
         获取所有未安装的插件列表（存在于索引中但本地未安装）
@@ -898,7 +1028,7 @@ class PluginManager:
         
         # 获取本地已安装插件
         self.logger.debug("开始获取本地已安装插件")
-        installed_plugins = self.get_available_plugins()
+        installed_plugins = self.get_available_plugins_cached()
         self.logger.debug(f"已安装插件数量: {len(installed_plugins)}, 插件列表: {list(installed_plugins.keys())}")
         
         # 获取远程插件索引
@@ -952,7 +1082,7 @@ class PluginManager:
         
         # 获取已安装插件
         self.logger.debug("开始获取已安装插件")
-        installed_plugins = self.get_available_plugins()
+        installed_plugins = self.get_available_plugins_cached()
         self.logger.debug(f"已安装插件数量: {len(installed_plugins)}, 插件列表: {list(installed_plugins.keys())}")
         
         # 获取未安装插件
@@ -1178,6 +1308,8 @@ class PluginManager:
             version_file.write_text(plugin_info.get('plugin_version', 'unknown'), encoding='utf-8')
             self.logger.info(f"版本信息已写入: {plugin_info.get('plugin_version', 'unknown')}")
                 
+            self.invalidate_local_plugin_version(school_code)
+            self.clear_available_plugins_cache()
             self.logger.info(f"插件 {school_code} 安装成功")
             return True
                 
@@ -1201,8 +1333,20 @@ class PluginManager:
             # 首先尝试从插件目录加载
             plugin_dir = self.plugins_dir / school_code
             plugin_init_file = plugin_dir / "__init__.py"
+            
+            try:
+                mtime_ns = plugin_init_file.stat().st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            
+            with self._loaded_plugins_lock:
+                # 插件文件未变化时直接复用已加载的模块，避免重复执行插件代码
+                cached = self._loaded_plugins.get(school_code)
+                if cached is not None and mtime_ns is not None and cached[0] == mtime_ns:
+                    return cached[1]
+                self._loaded_plugins.pop(school_code, None)
                 
-            if plugin_init_file.exists():
+            if mtime_ns is not None:
                 self.logger.debug(f"尝试从插件目录加载插件: {school_code}")
                 # 为了支持相对导入，需要将插件目录添加到 sys.path
                 import sys
@@ -1221,6 +1365,8 @@ class PluginManager:
                 if plugin_dir_str in sys.path:
                     sys.path.remove(plugin_dir_str)
                 self.logger.debug(f"插件 {school_code} 加载成功")
+                with self._loaded_plugins_lock:
+                    self._loaded_plugins[school_code] = (mtime_ns, module)
                 return module
             else:
                 self.logger.debug(f"插件 {school_code} 不存在于插件目录中")
@@ -287,8 +287,14 @@ class PushManager:
             return False
 
 
-# 全局推送管理器实例
-push_manager = PushManager()
+# 全局推送管理器实例（延迟初始化：首次推送时才注册发送器并导入其依赖）
+_push_manager_instance = None
+
+def get_push_manager():
+    global _push_manager_instance
+    if _push_manager_instance is None:
+        _push_manager_instance = PushManager()
+    return _push_manager_instance
 
 
 def send_notification(sender_name, subject, content):
@@ -304,7 +310,7 @@ def send_notification(sender_name, subject, content):
         bool: 发送是否成功
     """
     logger.debug(f"调用 send_notification: sender={sender_name}, subject={subject}")
-    return push_manager.send_notification(sender_name, subject, content)
+    return get_push_manager().send_notification(sender_name, subject, content)
 
 
 # ==================== 消息格式化函数 ====================
@@ -485,28 +491,28 @@ def format_full_schedule(courses, week_count):
 def send_grade_mail(changed):
     """发送成绩变化通知"""
     text = format_grade_changes(changed)
-    return push_manager.send_with_active_sender("成绩有更新", text)
+    return get_push_manager().send_with_active_sender("成绩有更新", text)
 
 
 def send_all_grades_mail(grades):
     """发送全部成绩通知"""
     text = format_all_grades(grades)
-    return push_manager.send_with_active_sender("全部成绩", text)
+    return get_push_manager().send_with_active_sender("全部成绩", text)
 
 
 def send_schedule_mail(courses, week, weekday):
     """发送明日课表通知"""
     text = format_schedule(courses, week, weekday, "明日课表")
-    return push_manager.send_with_active_sender("明日课表提醒", text)
+    return get_push_manager().send_with_active_sender("明日课表提醒", text)
 
 
 def send_today_schedule_mail(courses, week, weekday):
     """发送今日课表通知"""
     text = format_schedule(courses, week, weekday, "今日课表")
-    return push_manager.send_with_active_sender("今日课表", text)
+    return get_push_manager().send_with_active_sender("今日课表", text)
 
 
 def send_full_schedule_mail(courses, week_count):
     """发送完整学期课表通知"""
     text = format_full_schedule(courses, week_count)
-    return push_manager.send_with_active_sender("本学期完整课表", text)
+    return get_push_manager().send_with_active_sender("本学期完整课表", text)
@@ -11,6 +11,14 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any
 from collections import defaultdict
 
+# 可选：orjson 解析/序列化更快，未安装时回退到标准库 json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 # 导入日志模块
 try:
     from .log import get_log_file_path, get_logger
@@ -148,8 +156,11 @@ def save_linear_schedule(linear_data: Dict[str, Any], filename: str = None) -> s
     save_path = appdata_dir / filename
     
     try:
-        with open(save_path, 'w', encoding='utf-8') as f:
-            json.dump(linear_data, f, ensure_ascii=False, indent=2)
+        if ORJSON_AVAILABLE:
+            save_path.write_bytes(orjson.dumps(linear_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(save_path, 'w', encoding='utf-8') as f:
+                json.dump(linear_data, f, ensure_ascii=False, indent=2)
         logger.info(f"线性课表数据已保存到: {save_path}")
         return str(save_path)
     except Exception as e:
@@ -173,8 +184,11 @@ def load_linear_schedule(filename: str = None) -> Dict[str, Any]:
     load_path = appdata_dir / filename
     
     try:
-        with open(load_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if ORJSON_AVAILABLE:
+            data = orjson.loads(load_path.read_bytes())
+        else:
+            with open(load_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         logger.info(f"成功加载线性课表数据: {load_path}")
         return data
     except FileNotFoundError:
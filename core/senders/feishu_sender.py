@@ -18,6 +18,7 @@ except ImportError:
 # 延迟初始化
 _logger = None
 _config_path = None
+_session = None
 
 def gen_sign(timestamp, secret):
     """生成飞书机器人签名校验所需的签名"""
@@ -41,6 +42,13 @@ def _get_config_path():
         _get_logger()
     return _config_path
 
+def _get_session():
+    """复用同一个 HTTP 会话，多次推送时保持连接，避免重复 TCP/TLS 握手"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
 class FeishuSender:
     """飞书机器人推送实现"""
     
@@ -88,7 +96,7 @@ class FeishuSender:
 
         try:
             logger.info(f"正在向飞书发送消息: {subject}")
-            response = requests.post(
+            response = _get_session().post(
                 webhook_url_with_params, 
                 data=json.dumps(payload), 
                 headers=headers,
@@ -18,6 +18,7 @@ except ImportError:
 # 延迟初始化日志（在第一次调用时初始化）
 _logger = None
 _config_path = None
+_session = None
 
 
 def _get_logger():
@@ -37,6 +38,14 @@ def _get_config_path():
     return _config_path
 
 
+def _get_session():
+    """复用同一个 HTTP 会话，多次推送时保持连接，避免重复 TCP/TLS 握手"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
+
 def sc_send(sendkey, title, desp='', options=None):
     """
     Server酱消息发送函数
@@ -73,7 +82,7 @@ def sc_send(sendkey, title, desp='', options=None):
         'Content-Type': 'application/json;charset=utf-8'
     }
     
-    response = requests.post(url, json=params, headers=headers)
+    response = _get_session().post(url, json=params, headers=headers)
     result = response.json()
     return result
 
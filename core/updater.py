@@ -11,6 +11,7 @@ import json
 import subprocess
 import tempfile
 import hashlib
+import time
 from pathlib import Path
 from typing import Optional, Tuple
 from core.log import get_logger
@@ -19,6 +20,32 @@ PROXY_URL_PREFIX = "https://ghfast.top/"
 
 logger = get_logger()
 
+PROGRESS_MIN_INTERVAL = 1 / 30  # 进度回调最小间隔（秒），即最多约 30 次/秒
+
+
+def _make_progress_hook(progress_callback):
+    """
+    构造 urlretrieve 使用的进度钩子
+    
+    进度未变化或距上次回调不足 PROGRESS_MIN_INTERVAL 时跳过回调，
+    避免每个数据块都触发一次界面刷新；100% 始终会回调。
+    """
+    state = {"progress": None, "time": 0.0}
+
+    def _progress_hook(block_num, block_size, total_size):
+        if progress_callback and total_size > 0:
+            progress = round(min(100, (block_num * block_size / total_size) * 100), 1)
+            if progress == state["progress"]:
+                return
+            now = time.monotonic()
+            if progress < 100 and now - state["time"] < PROGRESS_MIN_INTERVAL:
+                return
+            state["progress"] = progress
+            state["time"] = now
+            progress_callback(progress)
+
+    return _progress_hook
+
 
 def download_file(url: str, destination: str, expected_checksum: str = None, progress_callback=None) -> bool:
     """
@@ -37,10 +64,7 @@ def download_file(url: str, destination: str, expected_checksum: str = None, pro
         logger.info(f"正在下载文件: {url}")
         
         # 尝试直接下载
-        def _progress_hook(block_num, block_size, total_size):
-            if progress_callback and total_size > 0:
-                progress = min(100, (block_num * block_size / total_size) * 100)
-                progress_callback(progress)
+        _progress_hook = _make_progress_hook(progress_callback)
         
         # 尝试直接下载
         req = urllib.request.Request(
@@ -401,10 +425,7 @@ class Updater:
             download_path = temp_dir / target_name
             
             # 带进度的下载
-            def _progress_hook(block_num, block_size, total_size):
-                if progress_callback and total_size > 0:
-                    progress = min(100, (block_num * block_size / total_size) * 100)
-                    progress_callback(progress)
+            _progress_hook = _make_progress_hook(progress_callback)
             
             # 尝试直接下载
             req = urllib.request.Request(
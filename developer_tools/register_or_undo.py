@@ -6,6 +6,7 @@ import subprocess
 import winreg
 import ctypes
 import argparse
+from contextlib import contextmanager
 from pathlib import Path
 
 # 添加项目根目录到模块搜索路径
@@ -14,6 +15,17 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 
+RUN_KEY_PATH = r"Software\Microsoft\Windows\CurrentVersion\Run"
+
+
+@contextmanager
+def run_key(access=winreg.KEY_ALL_ACCESS):
+    """打开当前用户的 Run 注册表项，块内可批量写入/删除，结束时统一刷新一次"""
+    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, RUN_KEY_PATH, 0, access) as key:
+        yield key
+        winreg.FlushKey(key)
+
+
 def is_admin():
     """检查是否以管理员身份运行"""
     try:
@@ -65,9 +77,6 @@ def register_startup():
     print("正在注册开机启动项...")
     
     try:
-        # 注册开机启动项
-        key_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
-        
         # 获取当前脚本路径
         script_dir = Path(__file__).parent.parent
         executable_path = script_dir / "dist" / "CapturePush.exe"  # 假设您有打包后的exe
@@ -80,7 +89,7 @@ def register_startup():
         else:
             cmd = f'"{executable_path}"'
         
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path, 0, winreg.KEY_SET_VALUE) as key:
+        with run_key(winreg.KEY_SET_VALUE) as key:
             winreg.SetValueEx(key, "CapturePush", 0, winreg.REG_SZ, cmd)
         
         print("开机启动项注册完成")
@@ -95,9 +104,7 @@ def undo_register_startup():
     print("正在撤销开机启动项...")
     
     try:
-        key_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
-        
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path, 0, winreg.KEY_ALL_ACCESS) as key:
+        with run_key() as key:
             winreg.DeleteValue(key, "CapturePush")
         
         print("开机启动项撤销完成")
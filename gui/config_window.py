@@ -20,7 +20,7 @@ from gui.tabs.push_tab import PushTab
 from gui.tabs.about_tab import AboutTab
 from gui.tabs.plugin_management_tab import PluginManagementTab
 
-from core.config_manager import load_config
+from core.config_manager import load_config, save_config
 
 
 # 导入按钮处理函数
@@ -346,7 +346,6 @@ class ConfigWindow(QMainWindow):
                 import configparser
                 empty_config = configparser.ConfigParser()
                 # 保存空配置（这将加密并覆盖现有配置）
-                from core.config_manager import save_config
                 save_config(empty_config)
                 logger.info("配置已清除")
                 QMessageBox.information(self, "成功", "所有配置已清除！")
@@ -463,7 +462,6 @@ class ConfigWindow(QMainWindow):
                 self.config_manager["update"]["check_prerelease"] = str(prerelease_checkbox.isChecked())
                 
                 # 保存配置
-                from core.config_manager import save_config
                 save_config(self.config_manager)
                 
                 logger.info(f"日志级别已设置为 {log_combo.currentText()}")
@@ -1,64 +1,74 @@
-from PySide6.QtWidgets import QFrame, QVBoxLayout, QLabel
-from PySide6.QtCore import Qt
+from collections import namedtuple
+from PySide6.QtWidgets import QStyledItemDelegate
+from PySide6.QtCore import Qt, QRect
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter
+
+# 课表单元格数据：由模型通过 Qt.UserRole 提供，CourseBlockDelegate 负责绘制
+CourseCell = namedtuple("CourseCell", "name room teacher color row_span is_manual is_week_zero")
+
+# 十六进制颜色 -> QColor 缓存，课表只会用到少量颜色
+_QCOLOR_CACHE = {}
+
+def cached_qcolor(hex_color):
+    """返回缓存的 QColor，避免每次绘制都重新解析颜色字符串"""
+    color = _QCOLOR_CACHE.get(hex_color)
+    if color is None:
+        color = _QCOLOR_CACHE[hex_color] = QColor(hex_color)
+    return color
+
+class CourseBlockDelegate(QStyledItemDelegate):
+    """课表色块委托：直接在单元格上绘制圆角色块和课程信息，无需为每节课创建控件
+    
+    手动修改的课程不加边框，仅通过（调用方加深的）背景色区分。
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # 字体只创建一次：普通周 13px/11px，第0周 11px/9px
+        self.name_fonts = {}
+        self.name_metrics = {}
+        self.info_fonts = {}
+        for is_week_zero, name_px, info_px in ((False, 13, 11), (True, 11, 9)):
+            name_font = QFont("Microsoft YaHei")
+            name_font.setPixelSize(name_px)
+            name_font.setBold(True)
+            info_font = QFont("Microsoft YaHei")
+            info_font.setPixelSize(info_px)
+            self.name_fonts[is_week_zero] = name_font
+            self.name_metrics[is_week_zero] = QFontMetrics(name_font)
+            self.info_fonts[is_week_zero] = info_font
+
+    def paint(self, painter, option, index):
+        cell = index.data(Qt.UserRole)
+        if not isinstance(cell, CourseCell):
+            super().paint(painter, option, index)
+            return
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # 圆角背景（外边距 1px，圆角 6px）
+        rect = option.rect.adjusted(1, 1, -1, -1)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(cached_qcolor(cell.color))
+        painter.drawRoundedRect(rect, 6, 6)
+
+        # 文本区域（左右 4px，上下 6px 内边距）
+        text_rect = rect.adjusted(4, 6, -4, -6)
+        flags = Qt.AlignHCenter | Qt.AlignTop | Qt.TextWordWrap
+        painter.setPen(Qt.black)
+
+        painter.setFont(self.name_fonts[cell.is_week_zero])
+        name_height = self.name_metrics[cell.is_week_zero].boundingRect(text_rect, flags, cell.name).height()
+        painter.drawText(text_rect, flags, cell.name)
 
-class CourseBlock(QFrame):
-    """自定义课表色块"""
-    def __init__(self, name, room, teacher, color_hex, is_manual=False, is_week_zero=False):
-        super().__init__()
-        # 如果是手动添加的课程，使用稍微不同的样式
-        if is_manual:
-            # 手动添加的课程使用更深的颜色但无边框，仅通过颜色区分
-            self.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {color_hex};
-                    border-radius: 6px;
-                    margin: 1px;
-                }}
-                QLabel {{
-                    color: black;
-                    background: transparent;
-                    font-family: "Microsoft YaHei";
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {color_hex};
-                    border-radius: 6px;
-                    margin: 1px;
-                }}
-                QLabel {{
-                    color: black;
-                    background: transparent;
-                    font-family: "Microsoft YaHei";
-                }}
-            """)
-        
-        # 第0周使用更小的字体
-        name_font_size = "11px" if is_week_zero else "13px"
-        info_font_size = "9px" if is_week_zero else "11px"
-        
-        layout = QVBoxLayout(self)
-        layout.setAlignment(Qt.AlignCenter)  # 确保布局内容居中
-        layout.setContentsMargins(4, 6, 4, 6)  # 增加边距以改善视觉效果
-        layout.setSpacing(2)  # 增加间距
-        
-        name_label = QLabel(name)
-        name_label.setStyleSheet(f"font-weight: bold; font-size: {name_font_size};")
-        name_label.setWordWrap(True)
-        name_label.setAlignment(Qt.AlignCenter)
-        name_label.setContentsMargins(0, 0, 0, 0)  # 确保标签内部没有额外边距
-        
         info_text = ""
-        if room: info_text += f"@{room}\n"
-        if teacher: info_text += f"{teacher}"
-        
-        info_label = QLabel(info_text.strip())
-        info_label.setStyleSheet(f"font-size: {info_font_size};")
-        info_label.setWordWrap(True)
-        info_label.setAlignment(Qt.AlignCenter)
-        info_label.setContentsMargins(0, 0, 0, 0)  # 确保标签内部没有额外边距
-        
-        layout.addWidget(name_label)
-        layout.addWidget(info_label)
-        layout.addStretch()
\ No newline at end of file
+        if cell.room: info_text += f"@{cell.room}\n"
+        if cell.teacher: info_text += f"{cell.teacher}"
+        info_text = info_text.strip()
+        if info_text:
+            painter.setFont(self.info_fonts[cell.is_week_zero])
+            info_rect = QRect(text_rect)
+            info_rect.setTop(text_rect.top() + name_height + 2)
+            painter.drawText(info_rect, flags, info_text)
+
+        painter.restore()
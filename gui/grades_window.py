@@ -3,10 +3,13 @@ import subprocess
 import configparser
 from pathlib import Path
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, 
-    QHeaderView, QHBoxLayout, QPushButton, QMessageBox, QApplication
+    QWidget, QVBoxLayout, QTableView, QAbstractItemView,
+    QHeaderView, QHBoxLayout, QPushButton, QMessageBox, QApplication,
+    QStyle
+)
+from PySide6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, Signal
 )
-from PySide6.QtCore import Qt
 
 # 动态获取基础目录和配置路径
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -17,12 +20,6 @@ except ImportError:
     from core.log import get_config_path, get_log_file_path
     from core.config_manager import load_config
 
-# 使用插件管理器获取学校模块
-try:
-    from core.plugins.plugin_manager import PluginManager
-    plugin_manager = PluginManager()
-except ImportError:
-    plugin_manager = None
 
 CONFIG_FILE = str(get_config_path())
 APPDATA_DIR = get_log_file_path('gui').parent
@@ -33,10 +30,91 @@ def get_current_school_code():
     return cfg.get("account", "school_code", fallback="10546")
 
 def get_school_module(school_code):
-    """通过插件管理器获取学校模块"""
-    if plugin_manager:
-        return plugin_manager.load_plugin(school_code)
-    return None
+    """通过插件管理器获取学校模块（首次使用时才导入插件管理器）"""
+    try:
+        from core.plugins.plugin_manager import get_plugin_manager
+    except ImportError:
+        return None
+    return get_plugin_manager().load_plugin(school_code)
+
+GRADE_COLUMNS = ["学期", "课程名称", "成绩", "学分", "课程属性", "课程编号"]
+FETCH_BATCH_SIZE = 100  # 每批交给视图的行数
+
+class GradesTableModel(QAbstractTableModel):
+    """成绩表格模型：按列存储字符串，仅在绘制时由 data() 取值，不再为每个单元格创建 QTableWidgetItem"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns = [[] for _ in GRADE_COLUMNS]
+        self._total_rows = 0
+        self._row_count = 0  # 已交给视图的行数，其余行在滚动时由 fetchMore 分批加入
+
+    def set_grades(self, grades):
+        """用成绩字典列表整体替换数据（列式存储）"""
+        self.beginResetModel()
+        # 学期、课程属性、学分等列大量重复，相同文本复用同一个字符串对象
+        interned = {}
+        self._columns = [
+            [interned.setdefault(text, text) for text in (str(g.get(key, "")) for g in grades)]
+            for key in GRADE_COLUMNS
+        ]
+        self._total_rows = len(grades)
+        self._row_count = min(self._total_rows, FETCH_BATCH_SIZE)
+        self.endResetModel()
+
+    def clear(self):
+        self.set_grades([])
+
+    def column_texts(self, col):
+        """某列全部行（包括尚未交给视图的行）的去重文本"""
+        return set(self._columns[col])
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._row_count < self._total_rows
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(FETCH_BATCH_SIZE, self._total_rows - self._row_count)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._row_count, self._row_count + count - 1)
+        self._row_count += count
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(GRADE_COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._columns[index.column()][index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return GRADE_COLUMNS[section]
+        return None
+
+class RefreshSignals(QObject):
+    """刷新任务的信号载体（QRunnable 本身不能定义信号）"""
+    finished = Signal(bool, str)  # 成功标志和错误信息
+
+class RefreshGradesRunnable(QRunnable):
+    """在全局线程池中执行 go.py --fetch-grade，避免阻塞界面线程"""
+    def __init__(self, cmd):
+        super().__init__()
+        self.cmd = cmd
+        self.signals = RefreshSignals()
+
+    def run(self):
+        try:
+            CREATE_NO_WINDOW = 0x08000000
+            subprocess.Popen(self.cmd, creationflags=CREATE_NO_WINDOW).wait()
+            self.signals.finished.emit(True, "")
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
 
 class GradesWindow(QWidget):
     """独立窗口：查看成绩"""
@@ -44,35 +122,38 @@ class GradesWindow(QWidget):
         super().__init__()
         self.setWindowTitle("Capture_Push · 成绩查看")
         self.resize(900, 600)
+        self._refresh_runnable = None
         self.init_ui()
 
     def init_ui(self):
         layout = QVBoxLayout(self)
         
         # 表格配置
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["学期", "课程名称", "成绩", "学分", "课程属性", "课程编号"])
+        self.table = QTableView()
+        self.model = GradesTableModel(self)
+        self.table.setModel(self.model)
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        # 使用 Interactive 而非 ResizeToContents，避免每次数据变化都逐行测量文本宽度；
+        # 列宽在数据加载完成后统一计算一次
+        header.setSectionResizeMode(QHeaderView.Interactive)
         header.setSectionResizeMode(1, QHeaderView.Stretch) # 课程名称拉伸
         self.table.verticalHeader().setVisible(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers) # 不可编辑
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers) # 不可编辑
         
         layout.addWidget(self.table)
         
         # 底部按钮区（刷新与清除）
         bottom_layout = QHBoxLayout()
         
-        refresh_btn = QPushButton("刷新成绩 (从网络获取)")
-        refresh_btn.setStyleSheet("background-color: #0078d4; color: white; font-weight: bold;")
-        refresh_btn.clicked.connect(self.refresh_data)
+        self.refresh_btn = QPushButton("刷新成绩 (从网络获取)")
+        self.refresh_btn.setStyleSheet("background-color: #0078d4; color: white; font-weight: bold;")
+        self.refresh_btn.clicked.connect(self.refresh_data)
         
         clear_btn = QPushButton("清除成绩缓存")
         clear_btn.setStyleSheet("color: #d83b01; font-weight: bold;")
         clear_btn.clicked.connect(self.clear_grade_cache)
         
-        bottom_layout.addWidget(refresh_btn)
+        bottom_layout.addWidget(self.refresh_btn)
         bottom_layout.addStretch()
         bottom_layout.addWidget(clear_btn)
         layout.addLayout(bottom_layout)
@@ -86,10 +167,13 @@ class GradesWindow(QWidget):
         self.load_data()
 
     def refresh_data(self):
-        """手动触发网络刷新"""
+        """手动触发网络刷新（在线程池中执行，不阻塞界面）"""
+        # 正在刷新时直接忽略，防止重复点击启动多个抓取进程
+        if self._refresh_runnable is not None:
+            return
+        
         # 禁用按钮防止重复点击
-        sender = self.sender()
-        if sender: sender.setEnabled(False)
+        self.refresh_btn.setEnabled(False)
         QApplication.setOverrideCursor(Qt.WaitCursor)
         
         try:
@@ -102,24 +186,29 @@ class GradesWindow(QWidget):
                 
             go_script = str(BASE_DIR / "core" / "go.py")
             
-            # 使用 subprocess 运行
-            CREATE_NO_WINDOW = 0x08000000
-            subprocess.Popen([py_exe, go_script, "--fetch-grade", "--force"], 
-                            creationflags=CREATE_NO_WINDOW).wait()
-            
+            self._refresh_runnable = RefreshGradesRunnable([py_exe, go_script, "--fetch-grade", "--force"])
+            self._refresh_runnable.signals.finished.connect(self.on_refresh_finished)
+            QThreadPool.globalInstance().start(self._refresh_runnable)
+        except Exception as e:
+            self.on_refresh_finished(False, str(e))
+
+    def on_refresh_finished(self, success, error):
+        """刷新任务结束后的回调（在界面线程执行）"""
+        self._refresh_runnable = None
+        QApplication.restoreOverrideCursor()
+        self.refresh_btn.setEnabled(True)
+        
+        if success:
             self.load_data()
             QMessageBox.information(self, "刷新完成", "成绩数据已从网络同步。")
-        except Exception as e:
-            QMessageBox.critical(self, "刷新失败", f"无法执行刷新脚本：{e}")
-        finally:
-            QApplication.restoreOverrideCursor()
-            if sender: sender.setEnabled(True)
+        else:
+            QMessageBox.critical(self, "刷新失败", f"无法执行刷新脚本：{error}")
 
     def load_data(self):
         try:
             grade_html_file = APPDATA_DIR / "grade.html"
             if not grade_html_file.exists():
-                self.table.setRowCount(0)
+                self.model.clear()
                 return
 
             with open(grade_html_file, "r", encoding="utf-8") as f:
@@ -138,26 +227,44 @@ class GradesWindow(QWidget):
             if not isinstance(grades, list):
                 raise TypeError(f"插件parse_grades应返回列表，实际返回类型: {type(grades).__name__}")
             
-            if not grades:
-                self.table.setRowCount(0)
-                return
-
-            self.table.setRowCount(len(grades))
+            # 验证每个成绩条目必须是字典
             for i, g in enumerate(grades):
-                # 验证每个成绩条目必须是字典
                 if not isinstance(g, dict):
                     raise TypeError(f"成绩列表中第{i+1}项应为字典，实际类型: {type(g).__name__}")
-                    
-                self.table.setItem(i, 0, QTableWidgetItem(str(g.get("学期", ""))))
-                self.table.setItem(i, 1, QTableWidgetItem(str(g.get("课程名称", ""))))
-                self.table.setItem(i, 2, QTableWidgetItem(str(g.get("成绩", ""))))
-                self.table.setItem(i, 3, QTableWidgetItem(str(g.get("学分", ""))))
-                self.table.setItem(i, 4, QTableWidgetItem(str(g.get("课程属性", ""))))
-                self.table.setItem(i, 5, QTableWidgetItem(str(g.get("课程编号", ""))))
+
+            # 整体替换模型数据，由视图按需绘制；列宽只在填充完成后计算一次
+            self.table.setUpdatesEnabled(False)
+            try:
+                self.model.set_grades(grades)
+                self.table.resizeColumnsToContents()
+                self.fit_columns_to_all_rows()
+            finally:
+                self.table.setUpdatesEnabled(True)
                 
         except Exception as e:
             QMessageBox.critical(self, "加载失败", f"查看成绩时发生错误：\n{str(e)}")
 
+    def fit_columns_to_all_rows(self):
+        """
+        按全部行的文本加宽列
+
+        resizeColumnsToContents 只测量已交给视图的首批行，之后由 fetchMore 加入的较长文本
+        会被截断；这里直接按列数据（去重后）用字体度量计算所需宽度，只加宽不缩窄
+        """
+        header = self.table.horizontalHeader()
+        metrics = self.table.fontMetrics()
+        # 与委托计算单元格尺寸时的文本左右边距一致
+        padding = 2 * (self.table.style().pixelMetric(QStyle.PM_FocusFrameHMargin, None, self.table) + 1)
+        for col in range(self.model.columnCount()):
+            if header.sectionResizeMode(col) != QHeaderView.Interactive:
+                continue
+            texts = self.model.column_texts(col)
+            if not texts:
+                continue
+            width = max(metrics.horizontalAdvance(text) for text in texts) + padding
+            if width > header.sectionSize(col):
+                header.resizeSection(col, width)
+
     def clear_grade_cache(self):
         """清除成绩缓存"""
         reply = QMessageBox.question(self, "确认清除", "确定要清除成绩缓存文件吗？", 
@@ -1,68 +1,335 @@
+import os
+import re
 import sys
 import json
-import subprocess
-import configparser
+import datetime
+import threading
+import functools
+import importlib.util
+import itertools
+import time
 from pathlib import Path
+# 可选：orjson 解析/序列化更快，未安装时回退到标准库 json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, 
+    QWidget, QVBoxLayout, QTableView, QAbstractItemView,
     QHeaderView, QHBoxLayout, QPushButton, QMessageBox, 
     QApplication, QLabel, QSpinBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, Signal, QTimer,
+    QAbstractTableModel, QModelIndex
+)
 from PySide6.QtGui import QColor
 
 # 定义项目根目录
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-# 导入日志模块和配置管理
+# 导入日志模块和配置管理（GUI 以包方式导入时走第一个分支，不再先失败一次）
 try:
-    from log import get_config_path, get_log_file_path, get_logger
-    from config_manager import load_config
-    logger = get_logger('schedule_window')
-except ImportError:
     from core.log import get_config_path, get_log_file_path, get_logger
-    from core.config_manager import load_config
-    logger = get_logger('schedule_window')
-
-# 使用插件管理器获取学校模块
-try:
-    from core.plugins.plugin_manager import PluginManager
-    plugin_manager = PluginManager()
+    from core.config_manager import load_config, save_config
 except ImportError:
-    plugin_manager = None
+    from log import get_config_path, get_log_file_path, get_logger
+    from config_manager import load_config, save_config
+logger = get_logger('schedule_window')
 
-# 导入自定义组件和对话框
+
+# 导入自定义组件（编辑对话框在首次双击时再导入）
 try:
-    from custom_widgets import CourseBlock
-    from dialogs import CourseEditDialog
+    from gui.custom_widgets import CourseCell, CourseBlockDelegate
 except ImportError:
-    from gui.custom_widgets import CourseBlock
-    from gui.dialogs import CourseEditDialog
+    from custom_widgets import CourseCell, CourseBlockDelegate
 
-# 导入线性化模块
+# 线性化模块只检查是否存在，首次读取线性化课表时再导入
 try:
-    from core.schedule_linearizer import load_linear_schedule
-    LINEARIZER_AVAILABLE = True
+    LINEARIZER_AVAILABLE = importlib.util.find_spec("core.schedule_linearizer") is not None
 except ImportError:
     LINEARIZER_AVAILABLE = False
-    load_linear_schedule = None
 
-CONFIG_FILE = str(get_config_path())
+CONFIG_PATH = get_config_path()
 APPDATA_DIR = get_log_file_path('gui').parent
 MANUAL_SCHEDULE_FILE = APPDATA_DIR / "manual_schedule.json"
 # 修正线性化JSON文件路径
 LINEAR_SCHEDULE_FILE = Path.home() / "AppData" / "Local" / "Capture_Push" / "linear_schedule.json"
+# 第0周原始课表的本地缓存（按院校+学号区分），有效期内不再调用插件抓取
+RAW_SCHEDULE_CACHE_DIR = APPDATA_DIR / "cache"
+RAW_SCHEDULE_CACHE_TTL = 6 * 3600  # 秒
+MANUAL_SAVE_DELAY_MS = 200  # 手动修改写盘的防抖延迟
+WEEK_CHANGE_DELAY_MS = 120  # 连续切换周次时只渲染最终停留的周次
+CONFIG_SAVE_DELAY_MS = 300  # 节次时间修改写入配置的防抖延迟
+TIP_TEXT = "提示：双击单元格进行手动编辑"
+WEEK_KEY_RE = re.compile(r"第(\d+)周")
+
+def rata_die(year, month, day):
+    """公历日期转日序数（与 date.toordinal() 一致），1、2 月视为上一年的 13、14 月"""
+    if month < 3:
+        year -= 1
+        month += 12
+    return 365 * year + year // 4 - year // 100 + year // 400 + (153 * month - 457) // 5 + day - 306
+
+def parse_date_rata_die(date_str):
+    """解析 YYYY-MM-DD 为日序数，格式不合法时返回 None"""
+    try:
+        year, month, day = (int(part) for part in date_str.strip().split("-"))
+        # 按实际月份天数校验（如 2024-02-31 不合法），日序数仍由 rata_die 计算
+        datetime.date(year, month, day)
+    except (ValueError, AttributeError):
+        return None
+    return rata_die(year, month, day)
+
+@functools.lru_cache(maxsize=128)
+def format_weeks_tuple(weeks):
+    """将周次元组格式化为字符串，如 (1,2,3,5,7,8,9) -> "1-3,5,7-9"（结果按输入缓存）"""
+    if len(weeks) == 1:
+        return str(weeks[0])
+    
+    # 排序去重后，连续周次与其下标之差相同，按差值分组即得到各段
+    result = []
+    for _, run in itertools.groupby(enumerate(sorted(set(weeks))), lambda p: p[1] - p[0]):
+        first = last = next(run)[1]
+        for _, last in run:
+            pass
+        result.append(str(first) if first == last else f"{first}-{last}")
+    
+    return ','.join(result)
+
+@functools.lru_cache(maxsize=64)
+def adjust_color_brightness(hex_color, factor):
+    """调整颜色亮度，factor为正数变亮，负数变暗（课程颜色种类很少，结果按参数缓存）"""
+    # 移除 # 符号
+    hex_color = hex_color.lstrip('#')
+    try:
+        rgb = int(hex_color, 16)
+    except ValueError:
+        # 如果转换失败，返回原始颜色
+        return hex_color
+    # 逐通道调整并限制在0-255范围内
+    r = max(0, min(255, ((rgb >> 16) & 0xff) + factor))
+    g = max(0, min(255, ((rgb >> 8) & 0xff) + factor))
+    b = max(0, min(255, (rgb & 0xff) + factor))
+    return f"#{(r << 16) | (g << 8) | b:06x}"
+
+def read_json_file(path):
+    """读取 JSON 文件（orjson 可用时直接解析原始字节）"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def write_json_file(path, data, indent=True):
+    """写入 JSON 文件，中文不转义"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        Path(path).write_bytes(orjson.dumps(data, option=option))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2 if indent else None)
+
+# 手动修改写盘在线程池中进行；按提交序号串行化，旧数据不会覆盖新数据
+_manual_write_lock = threading.Lock()
+_manual_written_seq = 0
+
+def write_manual_schedule_file(data, seq):
+    """将手动修改写入临时文件后原子替换；序号不新于已写入（或已作废）的数据时跳过"""
+    global _manual_written_seq
+    with _manual_write_lock:
+        if seq <= _manual_written_seq:
+            return
+        tmp_file = MANUAL_SCHEDULE_FILE.with_suffix(".tmp")
+        write_json_file(tmp_file, data)
+        os.replace(tmp_file, MANUAL_SCHEDULE_FILE)
+        _manual_written_seq = seq
+
+def discard_manual_schedule_writes(seq):
+    """作废序号不大于 seq 的尚未执行的写盘任务"""
+    global _manual_written_seq
+    with _manual_write_lock:
+        _manual_written_seq = max(_manual_written_seq, seq)
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached(path_str, mtime_ns, size):
+    """按配置文件的 (路径, 修改时间, 大小) 缓存解析结果"""
+    return load_config()
+
+def load_config_cached():
+    """读取配置，文件未变化时复用上次的解析结果（返回对象是共享的，修改后须保存）"""
+    try:
+        st = os.stat(CONFIG_PATH)
+    except OSError:
+        # 配置文件不存在时由 load_config 负责创建默认配置
+        return load_config()
+    return _load_config_cached(str(CONFIG_PATH), st.st_mtime_ns, st.st_size)
+
+def parse_class_times(class_times_str, total_classes):
+    """解析逗号分隔的节次开始时间，并用空字符串补齐到 total_classes 节"""
+    class_times = list(map(str.strip, class_times_str.split(","))) if class_times_str else []
+    if len(class_times) < total_classes:
+        class_times.extend([""] * (total_classes - len(class_times)))
+    return class_times
 
 def get_current_school_code():
     """从配置文件中获取当前院校代码"""
-    cfg = load_config()
+    cfg = load_config_cached()
     return cfg.get("account", "school_code", fallback="10546")
 
 def get_school_module(school_code):
-    """通过插件管理器获取学校模块"""
-    if plugin_manager:
-        return plugin_manager.load_plugin(school_code)
-    return None
+    """通过插件管理器获取学校模块（首次使用时才导入插件管理器）"""
+    try:
+        from core.plugins.plugin_manager import get_plugin_manager
+    except ImportError:
+        return None
+    return get_plugin_manager().load_plugin(school_code)
+
+DAY_HEADERS = ["时间/节次", "周一", "周二", "周三", "周四", "周五", "周六", "周日"]
+TIME_COLUMN_BACKGROUND = QColor("#f8f9fa")
+
+class ScheduleGridModel(QAbstractTableModel):
+    """课表网格模型：第0列为节次时间，其余列为星期；课程以 CourseCell 形式按 (行, 列) 存放，由委托绘制"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._time_texts = []
+        self._cells = {}
+
+    def set_time_texts(self, time_texts):
+        """设置节次列文本（行数随之变化；内容未变时不做任何通知）"""
+        if time_texts == self._time_texts:
+            return
+        if len(time_texts) != len(self._time_texts):
+            self.beginResetModel()
+            self._time_texts = list(time_texts)
+            self._cells = {}
+            self.endResetModel()
+        else:
+            self._time_texts = list(time_texts)
+            if time_texts:
+                self.dataChanged.emit(self.index(0, 0), self.index(len(time_texts) - 1, 0))
+
+    def set_cells(self, cells):
+        """整体替换课程单元格 {(row, col): CourseCell}"""
+        self.beginResetModel()
+        self._cells = cells
+        self.endResetModel()
+
+    def cells(self):
+        return self._cells
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._time_texts)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(DAY_HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if col == 0:
+            if role == Qt.DisplayRole:
+                return self._time_texts[row]
+            if role == Qt.TextAlignmentRole:
+                return int(Qt.AlignCenter)
+            if role == Qt.BackgroundRole:
+                return TIME_COLUMN_BACKGROUND
+            return None
+        if role == Qt.UserRole:
+            return self._cells.get((row, col))
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return DAY_HEADERS[section]
+        return None
+
+class RefreshSignals(QObject):
+    """刷新任务的信号载体（QRunnable 本身不能定义信号）"""
+    finished = Signal(bool, str)  # 成功标志和错误信息
+
+class RefreshScheduleRunnable(QRunnable):
+    """在全局线程池中执行 go.py --fetch-schedule，避免阻塞界面线程"""
+    def __init__(self, cmd):
+        super().__init__()
+        self.cmd = cmd
+        self.signals = RefreshSignals()
+
+    def run(self):
+        try:
+            import subprocess
+            CREATE_NO_WINDOW = 0x08000000
+            subprocess.Popen(self.cmd, creationflags=CREATE_NO_WINDOW).wait()
+            self.signals.finished.emit(True, "")
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
+
+class ManualSaveSignals(QObject):
+    """手动修改写盘任务的信号载体"""
+    finished = Signal(int, str)  # 提交序号和错误信息（成功时为空）
+
+class ManualSaveRunnable(QRunnable):
+    """在全局线程池中写入手动修改，避免阻塞界面线程"""
+    def __init__(self, data, seq):
+        super().__init__()
+        self.data = data
+        self.seq = seq
+        self.signals = ManualSaveSignals()
+
+    def run(self):
+        try:
+            write_manual_schedule_file(self.data, self.seq)
+            self.signals.finished.emit(self.seq, "")
+        except Exception as e:
+            self.signals.finished.emit(self.seq, str(e))
+
+class ParseScheduleSignals(QObject):
+    """强制解析任务的信号载体"""
+    finished = Signal(bool, str, int)  # 成功标志、错误信息、课程记录数
+
+class ParseScheduleRunnable(QRunnable):
+    """在全局线程池中调用院校插件获取课表并线性化保存，避免阻塞界面线程"""
+    def __init__(self, school_code, username, password, first_monday=None):
+        super().__init__()
+        self.school_code = school_code
+        self.username = username
+        self.password = password
+        self.first_monday = first_monday
+        self.signals = ParseScheduleSignals()
+
+    def run(self):
+        try:
+            school_mod = get_school_module(self.school_code)
+            if not school_mod:
+                self.signals.finished.emit(False, f"找不到院校模块: {self.school_code}", 0)
+                return
+            if not hasattr(school_mod, 'fetch_course_schedule'):
+                self.signals.finished.emit(False, f"院校模块 {self.school_code} 缺少 fetch_course_schedule 方法", 0)
+                return
+            
+            # 调用插件获取课表数据
+            schedule_data = school_mod.fetch_course_schedule(self.username, self.password, force_update=True)
+            if not schedule_data:
+                self.signals.finished.emit(False, "未能获取到课表数据，请检查网络连接和账号信息！", 0)
+                return
+            logger.info(f"成功获取课表数据，共 {len(schedule_data)} 条记录")
+            
+            # 线性化处理（学期开始日期可选）
+            from core.schedule_linearizer import linearize_schedule, save_linear_schedule
+            if self.first_monday:
+                linear_data = linearize_schedule(schedule_data, self.first_monday)
+            else:
+                linear_data = linearize_schedule(schedule_data)
+            
+            save_path = save_linear_schedule(linear_data, "linear_schedule.json")
+            logger.info(f"线性化课表已保存到: {save_path}")
+            self.signals.finished.emit(True, "", len(schedule_data))
+        except Exception as e:
+            logger.error(f"强制解析课表失败: {e}")
+            self.signals.finished.emit(False, f"课表解析失败：{e}", 0)
 
 class ScheduleViewerWindow(QWidget):
     """独立窗口：查看课表（色块展示版，支持周次切换）"""
@@ -77,74 +344,87 @@ class ScheduleViewerWindow(QWidget):
             "#D1FAE5", "#D1F2FA", "#D1D5FA", "#E9D1FA",
             "#FAD1F5", "#FAD1D1", "#F5F5F5", "#EEEEEE"
         ]
-        self.course_colors = {}
+        self.reset_course_colors()
         
         # 加载配置
-        self.cfg = load_config()
+        self.cfg = load_config_cached()
         self.first_monday_str = self.cfg.get("semester", "first_monday", fallback="")
+        # 第一周周一只解析一次，计算周次时仅做整数运算
+        self._first_monday_rd = parse_date_rata_die(self.first_monday_str) if self.first_monday_str else None
         
         # 加载学校时间设置
-        self.morning_count = self.cfg.getint("school_time", "morning_count", fallback=4)
-        self.afternoon_count = self.cfg.getint("school_time", "afternoon_count", fallback=4)
-        self.evening_count = self.cfg.getint("school_time", "evening_count", fallback=2)
-        self.total_classes = self.morning_count + self.afternoon_count + self.evening_count
-        
-        class_times_str = self.cfg.get("school_time", "class_times", fallback="")
-        self.class_times = []
-        if class_times_str:
-            self.class_times = [t.strip() for t in class_times_str.split(",")]
-        # 补齐
-        while len(self.class_times) < self.total_classes:
-            self.class_times.append("")
+        self._school_time_src = None
+        self.apply_school_time_cfg(self.cfg)
         
         self.current_week = self.calculate_current_week()
         self.selected_week = self.current_week
         
+        # 当前正在执行的刷新/解析任务（用于防止重复提交）
+        self._refresh_runnable = None
+        self._parse_runnable = None
+        # 缺少线性化文件时只自动解析一次，避免每次切换周次都重新联网
+        self._parse_attempted = False
+        
+        # 按文件 (mtime_ns, size) 缓存的解析结果，切换周次时无需重复读取和解析 JSON
+        self._linear_cache_key = None
+        self._linear_cache = None
+        self._linear_by_week = {}
+        self._manual_cache_key = None
+        self._manual_cache = {}
+        self._manual_entries_src = None
+        self._manual_entries = []
+        # 第0周聚合结果，与线性化数据缓存同步失效
+        self._aggregated_key = None
+        self._aggregated_courses = None
+        
+        # 手动修改的延迟写入：连续编辑只在停止后写一次盘
+        self._manual_pending = None
+        # 已提交但尚未确认写盘的手动修改 {序号: (任务, 数据)}
+        self._manual_seq = 0
+        self._manual_inflight = {}
+        self._manual_save_timer = QTimer(self)
+        self._manual_save_timer.setSingleShot(True)
+        self._manual_save_timer.setInterval(MANUAL_SAVE_DELAY_MS)
+        self._manual_save_timer.timeout.connect(self.flush_manual_schedule)
+        
+        # 节次时间的延迟写入：连续修改多节时间只保存一次配置
+        self._cfg_dirty = False
+        self._cfg_save_timer = QTimer(self)
+        self._cfg_save_timer.setSingleShot(True)
+        self._cfg_save_timer.setInterval(CONFIG_SAVE_DELAY_MS)
+        self._cfg_save_timer.timeout.connect(self.flush_config)
+        
+        # 当前渲染的自动解析课程索引 {(星期, 开始小节): 课程字典}，双击时 O(1) 查找
+        self._by_cell = {}
+        
         self.init_ui()
 
     def calculate_current_week(self):
         """根据第一周周一反推当前是第几周"""
-        if not self.first_monday_str:
-            return 1
-        try:
-            import datetime
-            first_monday = datetime.datetime.strptime(self.first_monday_str, "%Y-%m-%d").date()
-            today = datetime.date.today()
-            delta = (today - first_monday).days
-            if delta < 0: return 1
-            week = (delta // 7) + 1
-            return min(max(week, 1), 20) # 限制在 1-20 周
-        except:
+        if self._first_monday_rd is None:
             return 1
+        today = time.localtime()
+        delta = rata_die(today.tm_year, today.tm_mon, today.tm_mday) - self._first_monday_rd
+        if delta < 0: return 1
+        week = (delta // 7) + 1
+        return min(max(week, 1), 20) # 限制在 1-20 周
+
+    def reset_course_colors(self):
+        """清空课程颜色分配，下次渲染时从调色板开头重新分配"""
+        self.course_colors = {}
+        self._color_iter = itertools.cycle(self.colors)
 
     def get_color(self, course_name):
-        """为课程名分配固定颜色"""
-        if course_name not in self.course_colors:
-            color_idx = len(self.course_colors) % len(self.colors)
-            self.course_colors[course_name] = self.colors[color_idx]
-        return self.course_colors[course_name]
+        """为课程名分配固定颜色（按首次出现顺序循环使用调色板）"""
+        color = self.course_colors.get(course_name)
+        if color is None:
+            color = next(self._color_iter)
+            self.course_colors[course_name] = color
+        return color
 
     def adjust_color_brightness(self, hex_color, factor):
         """调整颜色亮度，factor为正数变亮，负数变暗"""
-        # 移除 # 符号
-        hex_color = hex_color.lstrip('#')
-        # 解析RGB值
-        try:
-            rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-            
-            # 调整每个颜色通道
-            adjusted_rgb = []
-            for val in rgb:
-                new_val = val + factor
-                # 确保值在0-255范围内
-                new_val = max(0, min(255, new_val))
-                adjusted_rgb.append(new_val)
-            
-            # 转换回十六进制
-            return '#{0:02x}{1:02x}{2:02x}'.format(*adjusted_rgb)
-        except:
-            # 如果转换失败，返回原始颜色
-            return hex_color
+        return adjust_color_brightness(hex_color, factor)
 
     def init_ui(self):
         layout = QVBoxLayout(self)
@@ -160,6 +440,11 @@ class ScheduleViewerWindow(QWidget):
         self.week_combo.setValue(self.selected_week)
         self.week_combo.setPrefix("第 ")
         self.week_combo.setSuffix(" 周")
+        # 按住箭头或滚动滚轮时 valueChanged 会连续触发，渲染延迟到停止切换后进行
+        self._week_render_timer = QTimer(self)
+        self._week_render_timer.setSingleShot(True)
+        self._week_render_timer.setInterval(WEEK_CHANGE_DELAY_MS)
+        self._week_render_timer.timeout.connect(self.render_week)
         self.week_combo.valueChanged.connect(self.on_week_changed)
         top_ctrl.addWidget(self.week_combo)
         
@@ -169,16 +454,16 @@ class ScheduleViewerWindow(QWidget):
         self.update_this_week_label()
             
         top_ctrl.addStretch()
-        self.tip_label = QLabel("提示：双击单元格进行手动编辑")
+        self.tip_label = QLabel(TIP_TEXT)
         top_ctrl.addWidget(self.tip_label)
         layout.addLayout(top_ctrl)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(8) # 1列节次 + 7列星期
-        self.table.setRowCount(self.total_classes)
-        
-        days = ["时间/节次", "周一", "周二", "周三", "周四", "周五", "周六", "周日"]
-        self.table.setHorizontalHeaderLabels(days)
+        # 1列节次 + 7列星期；课程色块由委托直接绘制，不再为每节课创建控件
+        self.table = QTableView()
+        self.model = ScheduleGridModel(self)
+        self.table.setModel(self.model)
+        self.course_delegate = CourseBlockDelegate(self.table)
+        self.table.setItemDelegate(self.course_delegate)
         
         # 设置表头样式
         header = self.table.horizontalHeader()
@@ -187,12 +472,13 @@ class ScheduleViewerWindow(QWidget):
         self.table.setColumnWidth(0, 100) # 加宽时间列
         
         self.table.verticalHeader().setVisible(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setSelectionMode(QTableWidget.NoSelection)
+        self.table.verticalHeader().setDefaultSectionSize(75)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionMode(QAbstractItemView.NoSelection)
         self.table.setShowGrid(False) # 隐藏网格线
         
         # 绑定双击事件
-        self.table.cellDoubleClicked.connect(self.on_cell_double_clicked)
+        self.table.doubleClicked.connect(self.on_index_double_clicked)
 
         # 初始化节次列 (现在包含时间)
         self.update_time_column()
@@ -202,15 +488,15 @@ class ScheduleViewerWindow(QWidget):
         # 底部按钮区（添加刷新和清除）
         bottom_layout = QHBoxLayout()
         
-        refresh_btn = QPushButton("刷新课表 (从网络获取)")
-        refresh_btn.setStyleSheet("background-color: #0078d4; color: white; font-weight: bold;")
-        refresh_btn.clicked.connect(self.refresh_data)
+        self.refresh_btn = QPushButton("刷新课表 (从网络获取)")
+        self.refresh_btn.setStyleSheet("background-color: #0078d4; color: white; font-weight: bold;")
+        self.refresh_btn.clicked.connect(self.refresh_data)
         
         clear_btn = QPushButton("清除课表数据 (含手动修改)")
         clear_btn.setStyleSheet("color: #d83b01; font-weight: bold;")
         clear_btn.clicked.connect(self.clear_schedule_cache)
         
-        bottom_layout.addWidget(refresh_btn)
+        bottom_layout.addWidget(self.refresh_btn)
         bottom_layout.addStretch()
         bottom_layout.addWidget(clear_btn)
         layout.addLayout(bottom_layout)
@@ -220,16 +506,19 @@ class ScheduleViewerWindow(QWidget):
     def on_week_changed(self, value):
         self.selected_week = value
         self.update_this_week_label()
+        self.update_tip_label()
         
-        # 更新提示信息
-        if value == 0:
+        # 仅周次变化，配置与节次列不变，只需重新放置课程（防抖后执行）
+        self._week_render_timer.start()
+
+    def update_tip_label(self, text=None):
+        """更新提示信息：指定 text 时显示该文本（如后台任务进度），否则按当前选择的周次显示"""
+        if text is None and self.selected_week == 0:
             self.tip_label.setText("提示：第0周展示本学期所有课程，相同时间段的课程将聚合显示")
             self.tip_label.setStyleSheet("color: #d83b01; font-weight: bold;")
         else:
-            self.tip_label.setText("提示：双击单元格进行手动编辑")
+            self.tip_label.setText(TIP_TEXT if text is None else text)
             self.tip_label.setStyleSheet("")
-            
-        self.load_data()
 
     def update_this_week_label(self):
         """更新本周标识标签"""
@@ -243,14 +532,15 @@ class ScheduleViewerWindow(QWidget):
             self.this_week_label.setText(f"(本周是第 {self.current_week} 周)")
 
     def update_time_column(self):
-        for i in range(self.total_classes):
-            time_str = self.class_times[i] if i < len(self.class_times) else ""
-            text = f"{time_str}\n(第 {i+1} 节)"
-            item = QTableWidgetItem(text)
-            item.setTextAlignment(Qt.AlignCenter)
-            item.setBackground(QColor("#f8f9fa"))
-            self.table.setItem(i, 0, item)
-            self.table.setRowHeight(i, 75)
+        # class_times 已补齐到 total_classes，可直接按节次取值
+        self.model.set_time_texts([
+            f"{time_str}\n(第 {i} 节)"
+            for i, time_str in enumerate(self.class_times[:self.total_classes], 1)
+        ])
+
+    def on_index_double_clicked(self, index):
+        """视图双击信号适配"""
+        self.on_cell_double_clicked(index.row(), index.column())
 
     def on_cell_double_clicked(self, row, col):
         """双击单元格打开编辑对话框"""
@@ -267,14 +557,11 @@ class ScheduleViewerWindow(QWidget):
                         self.class_times.append("")
                     self.class_times[row] = new_time
                 
-                # 保存到配置
+                # 更新配置，稍后统一保存
                 if "school_time" not in self.cfg: self.cfg["school_time"] = {}
                 self.cfg["school_time"]["class_times"] = ",".join(self.class_times)
-                try:
-                    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-                        self.cfg.write(f)
-                except:
-                    pass
+                self._cfg_dirty = True
+                self._cfg_save_timer.start()
                 
                 self.update_time_column()
             return
@@ -287,55 +574,52 @@ class ScheduleViewerWindow(QWidget):
         if manual_key in manual_data:
             existing_data = manual_data[manual_key]
         else:
-            # 如果没有手动修改过，现在只使用线性化JSON数据
-            # 不再从HTML文件中查找自动解析的课程数据
-            existing_data = {}
+            # 如果没有手动修改过，从本次渲染时建立的索引中取自动解析的课程
+            s = self._by_cell.get((col, row + 1))
+            if s:
+                start = s.get("开始小节", row + 1)
+                existing_data = {
+                    "课程名称": s.get("课程名称", ""),
+                    "教室": s.get("教室", ""),
+                    "教师": s.get("教师", ""),
+                    "row_span": max(s.get("结束小节", start) - start + 1, 1),
+                }
+                # 线性化条目只记录所属的单个周次，实际上课周次需从各周数据中汇总
+                weeks = self.course_weeks(s.get("星期"), start, existing_data["课程名称"])
+                if weeks:
+                    existing_data["上课周次"] = self.format_weeks_list(weeks)
+        
+        try:
+            from gui.dialogs import CourseEditDialog
+        except ImportError:
+            from dialogs import CourseEditDialog
         
         self.current_editing_pos = (row, col)
         self.edit_dialog = CourseEditDialog(self, existing_data)
         self.edit_dialog.show()
         
+    def course_weeks(self, day, start, name):
+        """汇总某门课程（按星期、开始小节、课程名称匹配）在各周的上课周次"""
+        return sorted(
+            week for week, courses in self._linear_by_week.items()
+            if any(c.get("星期") == day and c.get("开始小节") == start and c.get("课程名称") == name
+                   for c in courses)
+        )
+
     def format_weeks_list(self, weeks_list):
         """将周次列表格式化为字符串"""
         if not weeks_list or "全学期" in weeks_list:
             return "1-20"
-        
-        if not weeks_list:
-            return "1-20"
-            
-        # 尝试将连续数字合并为范围，如 [1,2,3,5,7,8,9] -> "1-3,5,7-9"
-        if len(weeks_list) == 1:
-            return str(weeks_list[0])
-        
-        # 排序
-        weeks_list = sorted(set(weeks_list))
-        
-        result = []
-        i = 0
-        while i < len(weeks_list):
-            start = weeks_list[i]
-            end = start
-            
-            # 查找连续序列
-            while i + 1 < len(weeks_list) and weeks_list[i + 1] == end + 1:
-                end = weeks_list[i + 1]
-                i += 1
-            
-            if start == end:
-                result.append(str(start))
-            else:
-                result.append(f"{start}-{end}")
-            
-            i += 1
-        
-        return ','.join(result)
+        # 相同的周次列表在课表中大量重复，转为元组后走缓存
+        return format_weeks_tuple(tuple(weeks_list))
 
     def on_dialog_finished(self, result):
         """对话框保存后的回调"""
         row, col = self.current_editing_pos
         manual_key = f"{col}-{row+1}" # 星期-开始小节
         
-        manual_data = self.load_manual_schedule()
+        # 复制一份再修改，避免污染缓存
+        manual_data = dict(self.load_manual_schedule())
         if not result.get("课程名称"):
             # 如果名称为空，视为删除该位置的手动修改
             if manual_key in manual_data:
@@ -344,45 +628,168 @@ class ScheduleViewerWindow(QWidget):
             manual_data[manual_key] = result
             
         self.save_manual_schedule(manual_data)
-        self.load_data() # 重新渲染
+        self.render_week() # 重新渲染
+
+    @staticmethod
+    def file_cache_key(path):
+        """文件缓存键 (mtime_ns, size)，文件不存在时返回 None"""
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
 
     def load_manual_schedule(self):
-        """加载手动修改的课表数据"""
-        if not MANUAL_SCHEDULE_FILE.exists():
+        """加载手动修改的课表数据（文件未变化时复用缓存，调用方不应直接修改返回值）"""
+        # 尚未写盘（或正在写盘）的修改优先
+        if self._manual_pending is not None:
+            return self._manual_pending
+        job = self._manual_inflight.get(self._manual_seq)
+        if job is not None:
+            return job[1]
+        key = self.file_cache_key(MANUAL_SCHEDULE_FILE)
+        if key is None:
             return {}
+        if key == self._manual_cache_key:
+            return self._manual_cache
         try:
-            with open(MANUAL_SCHEDULE_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            data = read_json_file(MANUAL_SCHEDULE_FILE)
         except:
             return {}
+        self._manual_cache_key = key
+        self._manual_cache = data
+        return data
+
+    def load_linear_data(self):
+        """加载线性化课表数据（文件未变化时复用缓存）"""
+        key = self.file_cache_key(LINEAR_SCHEDULE_FILE)
+        if key is None:
+            return None
+        if key != self._linear_cache_key:
+            from core.schedule_linearizer import load_linear_schedule
+            self._linear_cache = load_linear_schedule("linear_schedule.json")
+            self._linear_cache_key = key
+            self._linear_by_week = self.bucket_linear_data(self._linear_cache)
+        return self._linear_cache
+
+    @staticmethod
+    def bucket_linear_data(linear_data):
+        """将线性化数据按整数周次分桶：{周次: 课程列表}，切换周次时直接按键取"""
+        by_week = {}
+        if not linear_data or "data" not in linear_data:
+            return by_week
+        for week_key, week_data in linear_data["data"].items():
+            m = WEEK_KEY_RE.fullmatch(week_key)
+            if m:
+                by_week[int(m.group(1))] = week_data.get("课程列表", [])
+        return by_week
+
+    def invalidate_schedule_cache(self):
+        """清除已缓存的课表解析结果"""
+        self._linear_cache_key = None
+        self._linear_cache = None
+        self._linear_by_week = {}
+        self._manual_cache_key = None
+        self._manual_cache = {}
+        self._manual_entries_src = None
+        self._manual_entries = []
+        self._aggregated_key = None
+        self._aggregated_courses = None
+        # 课表来源已变化，颜色按新数据重新分配，并允许再次自动解析
+        self.reset_course_colors()
+        self._parse_attempted = False
 
     def save_manual_schedule(self, data):
-        """保存手动修改的课表数据"""
+        """保存手动修改的课表数据（防抖：短时间内多次保存只写一次盘）"""
+        self._manual_pending = data
+        self._manual_save_timer.start()
+
+    def flush_manual_schedule(self, wait=False):
+        """立即提交待写入的手动修改（先写临时文件再原子替换）
+        
+        Args:
+            wait: 为 True 时在当前线程同步写入（关闭窗口时使用），否则交给线程池
+        """
+        self._manual_save_timer.stop()
+        data = self._manual_pending
+        if data is None:
+            return
+        self._manual_pending = None
+        self._manual_seq += 1
+        seq = self._manual_seq
+        
+        if wait:
+            self._manual_inflight[seq] = (None, data)
+            try:
+                write_manual_schedule_file(data, seq)
+                self.on_manual_saved(seq, "")
+            except Exception as e:
+                self.on_manual_saved(seq, str(e))
+            return
+        
+        runnable = ManualSaveRunnable(data, seq)
+        runnable.signals.finished.connect(self.on_manual_saved)
+        self._manual_inflight[seq] = (runnable, data)
+        QThreadPool.globalInstance().start(runnable)
+
+    def on_manual_saved(self, seq, error):
+        """手动修改写盘结束后的回调（在界面线程执行）"""
+        job = self._manual_inflight.pop(seq, None)
+        if error:
+            QMessageBox.critical(self, "保存失败", f"无法保存手动修改：{error}")
+            return
+        if job is not None and seq == self._manual_seq:
+            # 最新一次写入的内容直接作为缓存，无需再读回
+            self._manual_cache_key = self.file_cache_key(MANUAL_SCHEDULE_FILE)
+            self._manual_cache = job[1]
+
+    def flush_config(self):
+        """立即保存尚未写入的节次时间修改"""
+        self._cfg_save_timer.stop()
+        if not self._cfg_dirty:
+            return
+        self._cfg_dirty = False
         try:
-            with open(MANUAL_SCHEDULE_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            save_config(self.cfg)
         except Exception as e:
-            QMessageBox.critical(self, "保存失败", f"无法保存手动修改：{e}")
+            logger.error(f"保存节次时间失败: {e}")
+        # 无论是否保存成功，都丢弃可能已被修改的缓存配置
+        _load_config_cached.cache_clear()
+
+    def closeEvent(self, event):
+        """关闭窗口前写入尚未保存的手动修改和节次时间"""
+        self.flush_manual_schedule(wait=True)
+        self.flush_config()
+        super().closeEvent(event)
 
     def clear_schedule_cache(self):
         """清除课表缓存"""
         reply = QMessageBox.question(self, "确认清除", "确定要清除所有课表缓存（包括手动修改的数据）吗？", 
                                    QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
+            # 丢弃尚未写盘的手动修改，并作废已提交但未执行的写盘任务
+            self._manual_save_timer.stop()
+            self._manual_pending = None
+            self._manual_inflight.clear()
+            discard_manual_schedule_writes(self._manual_seq)
             try:
                 # 只清除线性化JSON文件和手动修改数据
                 if LINEAR_SCHEDULE_FILE.exists(): LINEAR_SCHEDULE_FILE.unlink()
                 if MANUAL_SCHEDULE_FILE.exists(): MANUAL_SCHEDULE_FILE.unlink()
+                self.clear_raw_schedule_cache()
+                self.invalidate_schedule_cache()
                 QMessageBox.information(self, "成功", "课表数据已清除。")
                 self.load_data()
             except Exception as e:
                 QMessageBox.critical(self, "失败", f"清除失败：{e}")
 
     def refresh_data(self):
-        """手动触发网络刷新"""
+        """手动触发网络刷新（在线程池中执行，不阻塞界面）"""
+        if self._refresh_runnable is not None:
+            return
+        
         # 禁用按钮防止重复点击
-        sender = self.sender()
-        if sender: sender.setEnabled(False)
+        self.refresh_btn.setEnabled(False)
         QApplication.setOverrideCursor(Qt.WaitCursor)
         
         try:
@@ -394,18 +801,27 @@ class ScheduleViewerWindow(QWidget):
                 
             go_script = str(BASE_DIR / "core" / "go.py")
             
-            CREATE_NO_WINDOW = 0x08000000
-            subprocess.Popen([py_exe, go_script, "--fetch-schedule", "--force"], 
-                            creationflags=CREATE_NO_WINDOW).wait()
-            
+            self._refresh_runnable = RefreshScheduleRunnable([py_exe, go_script, "--fetch-schedule", "--force"])
+            self._refresh_runnable.signals.finished.connect(self.on_refresh_finished)
+            QThreadPool.globalInstance().start(self._refresh_runnable)
+        except Exception as e:
+            self.on_refresh_finished(False, str(e))
+
+    def on_refresh_finished(self, success, error):
+        """刷新任务结束后的回调（在界面线程执行）"""
+        self._refresh_runnable = None
+        QApplication.restoreOverrideCursor()
+        self.refresh_btn.setEnabled(True)
+        
+        if success:
+            # 网络数据已更新，原始课表缓存作废
+            self.clear_raw_schedule_cache()
+            self.invalidate_schedule_cache()
             # 刷新完成后重新加载数据（包括线性化JSON）
             self.load_data()
             QMessageBox.information(self, "刷新完成", "课表数据已从网络同步并更新线性化JSON文件。")
-        except Exception as e:
-            QMessageBox.critical(self, "刷新失败", f"无法执行刷新脚本：{e}")
-        finally:
-            QApplication.restoreOverrideCursor()
-            if sender: sender.setEnabled(True)
+        else:
+            QMessageBox.critical(self, "刷新失败", f"无法执行刷新脚本：{error}")
 
     def merge_consecutive_courses(self, schedule):
         """智能合并同一课程的连续时段
@@ -428,15 +844,16 @@ class ScheduleViewerWindow(QWidget):
         course_groups = {}
         
         for course in schedule:
+            get = course.get
             # 创建完整分组键：星期+课程名称+教师+教室+周次列表
-            weeks_list = sorted(course.get("周次列表", []))
+            weeks_list = sorted(get("周次列表", []))
             weeks_key = str(weeks_list) if weeks_list else "[]"
             
             key = (
-                course.get("星期", 0),
-                course.get("课程名称", ""),
-                course.get("教师", ""),
-                course.get("教室", ""),
+                get("星期", 0),
+                get("课程名称", ""),
+                get("教师", ""),
+                get("教室", ""),
                 weeks_key  # 关键：包含周次信息防止跨周次合并
             )
             
@@ -489,278 +906,193 @@ class ScheduleViewerWindow(QWidget):
 
     
     def force_parse_schedule(self):
-        """强制解析课表并生成线性化JSON文件"""
-        try:
-            logger.info("开始强制解析课表...")
-            
-            # 获取账户信息
-            cfg = load_config()
-            username = cfg.get("account", "username", fallback="")
-            password = cfg.get("account", "password", fallback="")
-            
-            if not username or not password:
-                QMessageBox.warning(self, "警告", "请先在基本设置中配置学号和密码！")
-                return False
-            
-            # 获取学校模块
-            school_code = get_current_school_code()
-            school_mod = get_school_module(school_code)
-            
-            if not school_mod:
-                QMessageBox.warning(self, "警告", f"找不到院校模块: {school_code}")
-                return False
-            
-            # 检查是否有所需的方法
-            if not hasattr(school_mod, 'fetch_course_schedule'):
-                QMessageBox.warning(self, "警告", f"院校模块 {school_code} 缺少 fetch_course_schedule 方法")
-                return False
-            
-            # 调用插件获取课表数据
-            schedule_data = school_mod.fetch_course_schedule(username, password, force_update=True)
-            
-            if not schedule_data:
-                QMessageBox.warning(self, "警告", "未能获取到课表数据，请检查网络连接和账号信息！")
-                return False
-            
-            logger.info(f"成功获取课表数据，共 {len(schedule_data)} 条记录")
-            
-            # 线性化处理
-            from core.schedule_linearizer import linearize_schedule, save_linear_schedule
-            
-            # 获取学期开始日期（可选）
-            first_monday = cfg.get("semester", "first_monday", fallback=None)
-            if first_monday:
-                linear_data = linearize_schedule(schedule_data, first_monday)
-            else:
-                linear_data = linearize_schedule(schedule_data)
-            
-            # 保存线性化数据
-            save_path = save_linear_schedule(linear_data, "linear_schedule.json")
-            logger.info(f"线性化课表已保存到: {save_path}")
-            
-            QMessageBox.information(self, "成功", f"课表解析完成！\n共处理 {len(schedule_data)} 条课程记录\n线性化数据已保存")
+        """强制解析课表并生成线性化JSON文件（在后台线程执行，完成后自动重新渲染）
+        
+        Returns:
+            是否已启动（或正在进行）解析任务
+        """
+        if self._parse_runnable is not None:
             return True
-            
-        except Exception as e:
-            logger.error(f"强制解析课表失败: {e}")
-            QMessageBox.critical(self, "错误", f"课表解析失败：{str(e)}")
+        
+        logger.info("开始强制解析课表...")
+        
+        # 获取账户信息
+        cfg = load_config_cached()
+        username = cfg.get("account", "username", fallback="")
+        password = cfg.get("account", "password", fallback="")
+        
+        if not username or not password:
+            QMessageBox.warning(self, "警告", "请先在基本设置中配置学号和密码！")
             return False
+        
+        school_code = get_current_school_code()
+        first_monday = cfg.get("semester", "first_monday", fallback=None)
+        
+        self._parse_runnable = ParseScheduleRunnable(school_code, username, password, first_monday)
+        self._parse_runnable.signals.finished.connect(self.on_parse_finished)
+        self.update_tip_label("正在解析课表，请稍候...")
+        QThreadPool.globalInstance().start(self._parse_runnable)
+        return True
+
+    def on_parse_finished(self, success, error, count):
+        """强制解析结束后的回调（在界面线程执行）"""
+        self._parse_runnable = None
+        self.update_tip_label()
+        
+        if not success:
+            QMessageBox.warning(self, "警告", error)
+            return
+        
+        self.invalidate_schedule_cache()
+        # 解析时已强制从网络获取新数据，原始课表缓存作废
+        self.clear_raw_schedule_cache()
+        QMessageBox.information(self, "成功", f"课表解析完成！\n共处理 {count} 条课程记录\n线性化数据已保存")
+        # 文件确实生成后才重新渲染，避免再次触发解析
+        if LINEAR_SCHEDULE_FILE.exists():
+            self.render_week()
     
-    def render_schedule(self, schedule_data, manual_data):
-        """渲染课表数据"""
-        # 准备合并：记录已占用的单元格，手动修改优先
-        occupied = set()
+    def apply_cells(self, cells):
+        """将课程单元格写入模型，并重建合并单元格（期间暂停重绘，结束后只刷新一次）"""
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table.clearSpans()
+            self.model.set_cells(cells)
+            for (row, col), cell in cells.items():
+                if cell.row_span > 1:
+                    self.table.setSpan(row, col, cell.row_span, 1)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
-        # 先处理手动修改
+    def prepare_manual_entries(self, manual_data):
+        """将手动修改数据预处理为 (col, row, row_span, 名称, 教室, 教师, 周次集合) 列表
+        
+        "列-节次" 键只解析一次，周次列表转为 frozenset；同一份手动数据重复渲染时直接复用。
+        """
+        if manual_data is self._manual_entries_src:
+            return self._manual_entries
+        entries = []
         for key, data in manual_data.items():
+            get = data.get
             col, start = map(int, key.split("-"))
-            row = start - 1
-            row_span = data.get("row_span", 1)
-            
+            entries.append((col, start - 1, get("row_span", 1), get("课程名称", ""),
+                            get("教室", ""), get("教师", ""), frozenset(get("周次列表") or ())))
+        self._manual_entries_src = manual_data
+        self._manual_entries = entries
+        return entries
+
+    def render_schedule(self, schedule_data, manual_data):
+        """渲染课表数据
+        
+        手动修改与自动解析的课程先统一整理为待放置条目（手动修改在前，优先级最高），
+        再由同一个循环按占用情况依次放置，已被占用的区域直接跳过。
+        """
+        total_classes = self.total_classes
+        selected_week = self.selected_week
+        # 待放置条目：(row, col, row_span, name, room, teacher, 取色用课程名, 是否手动修改, 是否第0周聚合, 原始课程)
+        items = []
+
+        # 先收集手动修改
+        for col, row, row_span, name, room, teacher, weeks in self.prepare_manual_entries(manual_data):
             # 检查周次是否包含在内
-            weeks_list = data.get("周次列表", [])
-            if self.selected_week != 0 and weeks_list and self.selected_week not in weeks_list:
+            if selected_week != 0 and weeks and selected_week not in weeks:
                 continue
 
-            name = data.get("课程名称", "")
-            room = data.get("教室", "")
-            teacher = data.get("教师", "")
-            
-            if 0 < col <= 7 and 0 < row < self.total_classes:
-                color = self.get_color(name)
-                # 标记手动修改，使用不同颜色区分
-                modified_color = self.adjust_color_brightness(color, -20)  # 稍微加深颜色表示手动修改
-                block = CourseBlock(name, room, teacher, modified_color, is_manual=True)
-                
-                actual_span = min(row_span, self.total_classes - row)
-                # 确保span是正整数且大于1
-                if isinstance(actual_span, int) and actual_span > 1:
-                    self.table.setSpan(row, col, actual_span, 1)
-                self.table.setCellWidget(row, col, block)
-                
-                for r in range(row, row + actual_span):
-                    occupied.add((r, col))
+            if 0 < col <= 7 and 0 < row < total_classes:
+                actual_span = min(row_span, total_classes - row)
+                # 确保span是正整数
+                if not isinstance(actual_span, int) or actual_span < 1:
+                    actual_span = 1
+                items.append((row, col, actual_span, name, room, teacher, name, True, False, None))
 
-        # 处理课表数据（可能是线性化的或传统的）
-        
         # 第0周特殊处理：按（星期，开始小节）分组进行合并显示
-        if self.selected_week == 0:
+        if selected_week == 0:
             # 使用字典按 (星期, 开始小节) 聚合课程
             merged_cells = {}
-            
             for s in schedule_data:
-                day_idx = s.get("星期", 0)
-                start = s.get("开始小节", 0)
-                end = s.get("结束小节", 0)
-                
-                if 0 < day_idx <= 7 and 0 < start <= self.total_classes:
-                    key = (day_idx, start)
-                    if key not in merged_cells:
-                        merged_cells[key] = []
-                    merged_cells[key].append(s)
+                get = s.get
+                day_idx = get("星期", 0)
+                start = get("开始小节", 0)
+                if 0 < day_idx <= 7 and 0 < start <= total_classes:
+                    merged_cells.setdefault((day_idx, start), []).append(s)
 
-            # 遍历聚合后的课程组进行渲染
             for (day_idx, start), courses in merged_cells.items():
-                row = start - 1
-                col = day_idx
-                
                 # 计算该时间段所有课程的最大结束节次，作为合并行数
                 max_end = start
                 for s in courses:
                     max_end = max(max_end, s.get("结束小节", start))
-                
-                effective_end = min(max_end, self.total_classes)
-                row_span = effective_end - start + 1
+                row_span = min(max_end, total_classes) - start + 1
                 
                 # 构建单元格显示文本
                 # 格式：[周次] 课程名 @教室 教师
                 display_texts = []
-                first_course_name = courses[0].get("课程名称", "")
-                
                 for s in courses:
-                    name = s.get("课程名称", "")
-                    room = s.get("教室", "")
-                    teacher = s.get("教师", "")
-                    weeks_list = s.get("周次列表", [])
-                    weeks_str = self.format_weeks_list(weeks_list)
+                    get = s.get
+                    room = get("教室", "")
+                    teacher = get("教师", "")
+                    weeks_str = self.format_weeks_list(get("周次列表", []))
                     
                     # 组合单门课程信息
-                    course_info = f"[{weeks_str}周] {name}"
+                    course_info = f"[{weeks_str}周] {get('课程名称', '')}"
                     details = []
                     if room: details.append(f"@{room}")
                     if teacher: details.append(f"{teacher}")
                     if details:
                         course_info += "\n" + " ".join(details)
-                    
                     display_texts.append(course_info)
                 
-                # 多门课程之间用空行分隔
-                final_text = "\n\n".join(display_texts)
-                
-                # 检查是否被手动修改占用（手动修改优先级最高）
-                if (row, col) in occupied:
+                # 多门课程之间用空行分隔，合并后的文本直接作为 name，其他字段置空
+                # （委托绘制时会自动处理换行），使用第一门课的颜色作为背景色
+                items.append((start - 1, day_idx, max(row_span, 1), "\n\n".join(display_texts), "", "",
+                              courses[0].get("课程名称", ""), False, True, None))
+        else:
+            for i, s in enumerate(schedule_data):
+                # 验证每个课表条目必须是字典
+                if not isinstance(s, dict):
+                    logger.warning(f"课表列表中第{i+1}项应为字典，实际类型: {type(s).__name__}")
                     continue
-                
-                # 检查合并区域是否被占用
-                can_place = True
-                for r in range(row, row + row_span):
-                    if (r, col) in occupied:
-                        can_place = False
-                        break
-                
-                if can_place:
-                    # 使用第一门课的颜色作为背景色
-                    color = self.get_color(first_course_name)
-                    
-                    # 将合并后的文本直接作为 name 传入，其他字段置空
-                    # CourseBlock 会自动处理换行
-                    block = CourseBlock(final_text, "", "", color, is_manual=False, is_week_zero=True)
                     
-                    # 设置合并单元格
-                    if isinstance(row_span, int) and row_span > 1:
-                        self.table.setSpan(row, col, row_span, 1)
-                        
-                    self.table.setCellWidget(row, col, block)
-                    
-                    # 标记占用
-                    for r in range(row, row + row_span):
-                        occupied.add((r, col))
-            
-            return # 第0周渲染结束，跳过后续常规渲染逻辑
-
-        for i, s in enumerate(schedule_data):
-            # 验证每个课表条目必须是字典
-            if not isinstance(s, dict):
-                logger.warning(f"课表列表中第{i+1}项应为字典，实际类型: {type(s).__name__}")
-                continue
+                # 线性化数据已按周分桶，这里的课程都属于当前周次
+                get = s.get
+                day_idx = get("星期", 0)
+                start = get("开始小节", 0)
                 
-            day_idx = s.get("星期", 0)
-            start = s.get("开始小节", 0)
-            end = s.get("结束小节", 0)
-            
-            # 对于线性化数据，所有课程都应该显示在当前周次
-            # 对于传统数据，需要检查周次
-            weeks_list = s.get("周次列表", [])
-            if self.selected_week != 0 and weeks_list and "全学期" not in weeks_list and self.selected_week not in weeks_list:
+                if 0 < day_idx <= 7 and 0 < start <= total_classes:
+                    name = get("课程名称", "")
+                    row_span = min(get("结束小节", 0), total_classes) - start + 1
+                    items.append((start - 1, day_idx, max(row_span, 1), name, get("教室", ""), get("教师", ""),
+                                  name, False, False, s))
+
+        # 统一放置：每列一个整数位图，第 r 位表示第 r 行已被占用
+        # 循环内用到的方法和容器先绑定为局部变量，避免逐条目的属性查找
+        cells = {}
+        by_cell = self._by_cell = {}
+        occupied_cols = [0] * 8
+        get_color = self.get_color
+        for row, col, row_span, name, room, teacher, color_name, is_manual, is_week_zero, source in items:
+            mask = ((1 << row_span) - 1) << row
+            if occupied_cols[col] & mask:
                 continue
+            occupied_cols[col] |= mask
             
-            if 0 < day_idx <= 7 and 0 < start <= self.total_classes:
-                row = start - 1
-                col = day_idx
-                
-                # 🔍 调试日志：追踪特定课程的渲染
-                if day_idx == 3 and start == 3 and end == 4:  # 周三3-4节
-                    logger.info(f"🔍 调试图标课程渲染:")
-                    logger.info(f"   课程名称: {s.get('课程名称', '未知')}")
-                    logger.info(f"   原始数据: 星期={day_idx}, 开始小节={start}, 结束小节={end}")
-                    logger.info(f"   计算结果: row={row}, col={col}")
-                    logger.info(f"   self.total_classes={self.total_classes}")
-                    logger.info(f"   表格当前行数: {self.table.rowCount()}")
-                
-                if (row, col) in occupied:
-                    continue # 手动修改已占用
-                    
-                name = s.get("课程名称", "")
-                room = s.get("教室", "")
-                teacher = s.get("教师", "")
-                
-                effective_end = min(end, self.total_classes)
-                row_span = effective_end - start + 1
-                
-                # 🔍 继续调试日志
-                if day_idx == 3 and start == 3 and end == 4:
-                    logger.info(f"   effective_end={effective_end}, row_span={row_span}")
-                    logger.info(f"   setSpan调用: setSpan({row}, {col}, {row_span}, 1)")
-                
-                # 检查跨度内是否被占用
-                can_place = True
-                for r in range(row, row + row_span):
-                    if (r, col) in occupied:
-                        can_place = False
-                        break
-                
-                if can_place:
-                    color = self.get_color(name)
-                    
-                    # 第0周强制显示周次范围
-                    if self.selected_week == 0:
-                        weeks_list = s.get("周次列表", [])
-                        weeks_str = self.format_weeks_list(weeks_list)
-                        if weeks_str:
-                            name = f"{name}\n[第{weeks_str}周]"
-                    
-                    # 自动解析的课程保持原色，手动添加的课程使用加深的颜色和虚线边框
-                    block = CourseBlock(name, room, teacher, color, is_manual=False)
-                    # 确保span是正整数且大于1
-                    if isinstance(row_span, int) and row_span > 1:
-                        # 🔍 添加额外的调试信息
-                        if day_idx == 3 and start == 3 and end == 4:
-                            logger.info(f"   🔍 即将调用setSpan前的状态:")
-                            logger.info(f"      occupied集合大小: {len(occupied)}")
-                            logger.info(f"      检查占用情况:")
-                            for r in range(row, row + row_span):
-                                is_occupied = (r, col) in occupied
-                                logger.info(f"         行{r}, 列{col}: {'已占用' if is_occupied else '未占用'}")
-                        
-                        self.table.setSpan(row, col, row_span, 1)
-                        
-                        # 🔍 检查setSpan后的状态
-                        if day_idx == 3 and start == 3 and end == 4:
-                            logger.info(f"   ✅ setSpan执行成功: ({row}, {col}, {row_span}, 1)")
-                            # 验证是否真的设置了合并
-                            try:
-                                actual_row_span = self.table.rowSpan(row, col)
-                                actual_col_span = self.table.columnSpan(row, col)
-                                logger.info(f"   📊 实际合并状态: rowSpan={actual_row_span}, columnSpan={actual_col_span}")
-                            except Exception as e:
-                                logger.error(f"   ❌ 检查合并状态时出错: {e}")
-                    self.table.setCellWidget(row, col, block)
-                    for r in range(row, row + row_span):
-                        occupied.add((r, col))
-                        # 🔍 调试occupied集合更新
-                        if day_idx == 3 and start == 3 and end == 4:
-                            logger.info(f"   ➕ 添加占用记录: ({r}, {col})")
+            color = get_color(color_name)
+            if is_manual:
+                # 手动修改使用稍微加深的颜色区分
+                color = adjust_color_brightness(color, -20)
+            cells[(row, col)] = CourseCell(name, room, teacher, color, row_span, is_manual, is_week_zero)
+            if source is not None:
+                by_cell[(col, row + 1)] = source
+        
+        self.apply_cells(cells)
     
+    def get_week_courses(self, linear_data, week):
+        """取某一周的课程列表：从加载时建立的周次分桶中直接取；第0周使用缓存的聚合结果"""
+        if week == 0:
+            if self._aggregated_courses is None or self._aggregated_key != self._linear_cache_key:
+                self._aggregated_courses = self.aggregate_all_courses(linear_data)
+                self._aggregated_key = self._linear_cache_key
+            return self._aggregated_courses
+        return self._linear_by_week.get(week)
+
     def aggregate_all_courses(self, linear_data):
         """聚合所有周次的课程数据，确保周次完整性"""
         import copy
@@ -771,15 +1103,16 @@ class ScheduleViewerWindow(QWidget):
         for week_key, week_data in linear_data["data"].items():
             courses = week_data.get("课程列表", [])
             for course in courses:
+                get = course.get
                 # 生成唯一键：星期+开始+结束+名称+教师+教室
                 # 这样相同的课程在不同周次出现时会被去重
                 key = (
-                    course.get("星期", 0),
-                    course.get("开始小节", 0),
-                    course.get("结束小节", 0),
-                    course.get("课程名称", ""),
-                    course.get("教师", ""),
-                    course.get("教室", "")
+                    get("星期", 0),
+                    get("开始小节", 0),
+                    get("结束小节", 0),
+                    get("课程名称", ""),
+                    get("教师", ""),
+                    get("教室", "")
                 )
                 
                 if key not in all_courses:
@@ -788,17 +1121,30 @@ class ScheduleViewerWindow(QWidget):
                 else:
                     # 合并周次列表，确保数据完整性
                     existing_weeks = set(all_courses[key].get("周次列表", []))
-                    new_weeks = set(course.get("周次列表", []))
+                    new_weeks = set(get("周次列表", []))
                     if new_weeks - existing_weeks:
                         combined = sorted(list(existing_weeks | new_weeks))
                         all_courses[key]["周次列表"] = combined
         
         return list(all_courses.values())
 
+    def raw_schedule_cache_path(self, school_code, username):
+        """第0周原始课表缓存文件路径"""
+        return RAW_SCHEDULE_CACHE_DIR / f"raw_schedule_{school_code}_{username}.json"
+
+    def clear_raw_schedule_cache(self):
+        """删除所有原始课表缓存文件"""
+        if RAW_SCHEDULE_CACHE_DIR.exists():
+            for cache_file in RAW_SCHEDULE_CACHE_DIR.glob("raw_schedule_*.json"):
+                try:
+                    cache_file.unlink()
+                except OSError as e:
+                    logger.warning(f"删除原始课表缓存失败: {e}")
+
     def fetch_raw_schedule_from_plugin(self):
-        """直接调用插件获取原始课表数据（非线性化）"""
+        """直接调用插件获取原始课表数据（非线性化），有效期内优先使用本地缓存"""
         try:
-            cfg = load_config()
+            cfg = load_config_cached()
             username = cfg.get("account", "username", fallback="")
             password = cfg.get("account", "password", fallback="")
             
@@ -806,6 +1152,17 @@ class ScheduleViewerWindow(QWidget):
                 return None
             
             school_code = get_current_school_code()
+            
+            # 缓存未过期时直接使用，避免再次走插件/网络
+            cache_file = self.raw_schedule_cache_path(school_code, username)
+            try:
+                if time.time() - cache_file.stat().st_mtime < RAW_SCHEDULE_CACHE_TTL:
+                    cached = read_json_file(cache_file)
+                    logger.debug("使用本地缓存的原始课表数据")
+                    return cached
+            except (OSError, ValueError):
+                pass
+            
             school_mod = get_school_module(school_code)
             
             if not school_mod or not hasattr(school_mod, 'fetch_course_schedule'):
@@ -813,42 +1170,69 @@ class ScheduleViewerWindow(QWidget):
                 
             # 调用插件，默认不强制更新，利用插件自身的缓存机制（如果有）
             logger.info("尝试直接从插件获取原始课表数据...")
-            return school_mod.fetch_course_schedule(username, password, force_update=False)
+            raw_data = school_mod.fetch_course_schedule(username, password, force_update=False)
+            
+            if raw_data:
+                try:
+                    RAW_SCHEDULE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    write_json_file(cache_file, raw_data, indent=False)
+                except (OSError, TypeError) as e:
+                    logger.warning(f"保存原始课表缓存失败: {e}")
+            return raw_data
         except Exception as e:
             logger.error(f"直接调用插件获取课表失败: {e}")
             return None
 
     def load_data(self):
+        """重新加载配置与节次列，然后渲染当前选中的周次"""
         try:
-            # 重新加载配置以获取最新的时间设置
-            self.cfg = load_config()
-            self.morning_count = self.cfg.getint("school_time", "morning_count", fallback=4)
-            self.afternoon_count = self.cfg.getint("school_time", "afternoon_count", fallback=4)
-            self.evening_count = self.cfg.getint("school_time", "evening_count", fallback=2)
-            self.total_classes = self.morning_count + self.afternoon_count + self.evening_count
-            
-            class_times_str = self.cfg.get("school_time", "class_times", fallback="")
-            self.class_times = []
-            if class_times_str:
-                self.class_times = [t.strip() for t in class_times_str.split(",")]
-            while len(self.class_times) < self.total_classes:
-                self.class_times.append("")
-            
-            # 更新行数和时间列
-            self.table.setRowCount(self.total_classes)
+            self.reload_sources()
+        except Exception as e:
+            QMessageBox.critical(self, "加载失败", f"渲染课表失败：{e}")
+            return
+        self.render_week()
+
+    def reload_sources(self):
+        """重新加载配置以获取最新的时间设置，并重建节次列"""
+        # 先保存未写入的修改，避免被重新读取的配置覆盖
+        self.flush_config()
+        self.cfg = load_config_cached()
+        # 配置未变化时节次设置和时间列都无需更新
+        if self.apply_school_time_cfg(self.cfg):
             self.update_time_column()
 
+    def apply_school_time_cfg(self, cfg):
+        """读取节次设置并缓存为普通属性；与上次是同一个配置对象时直接跳过
+        
+        Returns:
+            节次设置是否重新读取
+        """
+        if cfg is self._school_time_src:
+            return False
+        self._school_time_src = cfg
+        self.morning_count = cfg.getint("school_time", "morning_count", fallback=4)
+        self.afternoon_count = cfg.getint("school_time", "afternoon_count", fallback=4)
+        self.evening_count = cfg.getint("school_time", "evening_count", fallback=2)
+        self.total_classes = self.morning_count + self.afternoon_count + self.evening_count
+        
+        self.class_times = parse_class_times(
+            cfg.get("school_time", "class_times", fallback=""), self.total_classes)
+        return True
+
+    def render_week(self):
+        """只根据当前选中的周次重新放置课程（配置与节次列不变）"""
+        try:
             # 检查线性化JSON文件是否存在
             linear_schedule_data = None
             
             # 第0周特殊处理：优先直接调用插件获取原始数据
             if self.selected_week == 0:
-                logger.info("第0周模式：尝试直接调用插件获取原始课表数据...")
+                logger.debug("第0周模式：尝试直接调用插件获取原始课表数据...")
                 raw_data = self.fetch_raw_schedule_from_plugin()
                 if raw_data:
                     # 原始数据通常是列表，直接使用
                     linear_schedule_data = raw_data
-                    logger.info(f"成功从插件获取原始数据，共{len(linear_schedule_data)}条")
+                    logger.debug(f"成功从插件获取原始数据，共{len(linear_schedule_data)}条")
                 else:
                     logger.warning("从插件获取数据失败，将尝试降级使用线性化数据")
 
@@ -856,47 +1240,28 @@ class ScheduleViewerWindow(QWidget):
             if linear_schedule_data is None:
                 if LINEARIZER_AVAILABLE and LINEAR_SCHEDULE_FILE.exists():
                     try:
-                        linear_data = load_linear_schedule("linear_schedule.json")
+                        linear_data = self.load_linear_data()
                         if linear_data and "data" in linear_data:
+                            week_courses = self.get_week_courses(linear_data, self.selected_week)
                             if self.selected_week == 0:
                                 # 聚合模式：加载所有周次的课程
-                                linear_schedule_data = self.aggregate_all_courses(linear_data)
-                                logger.info(f"成功加载聚合课表数据，共{len(linear_schedule_data)}节课")
+                                linear_schedule_data = week_courses
+                                logger.debug(f"成功加载聚合课表数据，共{len(linear_schedule_data)}节课")
+                            elif week_courses is not None:
+                                linear_schedule_data = week_courses
+                                logger.debug(f"成功加载线性课表数据，第{self.selected_week}周共有{len(linear_schedule_data)}节课")
                             else:
-                                # 获取当前周次的数据
-                                current_week_key = f"第{self.selected_week}周"
-                                if current_week_key in linear_data["data"]:
-                                    week_data = linear_data["data"][current_week_key]
-                                    linear_schedule_data = week_data.get("课程列表", [])
-                                    logger.info(f"成功加载线性课表数据，第{self.selected_week}周共有{len(linear_schedule_data)}节课")
-                                else:
-                                    linear_schedule_data = []
-                                    logger.info(f"第{self.selected_week}周无课程数据，显示为空")
+                                linear_schedule_data = []
+                                logger.debug(f"第{self.selected_week}周无课程数据，显示为空")
                     except Exception as e:
                         logger.warning(f"加载线性课表数据失败: {e}")
                 else:
-                    # 如果没有线性化JSON文件，强制要求解析
-                    logger.info("未找到线性化课表文件，强制解析课表...")
-                    self.force_parse_schedule()
-                    # 重新尝试加载
-                    if LINEAR_SCHEDULE_FILE.exists():
-                        try:
-                            linear_data = load_linear_schedule("linear_schedule.json")
-                            if linear_data and "data" in linear_data:
-                                if self.selected_week == 0:
-                                    linear_schedule_data = self.aggregate_all_courses(linear_data)
-                                    logger.info(f"强制解析后加载聚合课表数据，共{len(linear_schedule_data)}节课")
-                                else:
-                                    current_week_key = f"第{self.selected_week}周"
-                                    if current_week_key in linear_data["data"]:
-                                        week_data = linear_data["data"][current_week_key]
-                                        linear_schedule_data = week_data.get("课程列表", [])
-                                        logger.info(f"强制解析后加载线性课表数据，第{self.selected_week}周共有{len(linear_schedule_data)}节课")
-                                    else:
-                                        linear_schedule_data = []
-                                        logger.info(f"第{self.selected_week}周无课程数据，显示为空")
-                        except Exception as e:
-                            logger.error(f"强制解析后加载仍失败: {e}")
+                    # 如果没有线性化JSON文件，在后台强制解析（每个数据来源只自动尝试一次，
+                    # 无论成败），完成后会重新渲染；此前先显示空白课表（含手动修改）
+                    if not self._parse_attempted:
+                        self._parse_attempted = True
+                        logger.info("未找到线性化课表文件，后台强制解析课表...")
+                        self.force_parse_schedule()
                         
             # 仅使用线性化数据，删除旧的HTML解析方案
             if linear_schedule_data is None:
@@ -910,18 +1275,7 @@ class ScheduleViewerWindow(QWidget):
                 schedule_data = linear_schedule_data
                 manual_data = self.load_manual_schedule()
             
-            # 清除之前的色块和合并单元格
-            for r in range(self.total_classes):
-                for c in range(1, 8):
-                    self.table.setCellWidget(r, c, None)
-                    # 🔍 彻底重置合并状态
-                    try:
-                        self.table.setSpan(r, c, 1, 1)
-                    except:
-                        pass
-                    # 不再重置span，因为默认就是(1,1)，避免警告
-
-            # 渲染课表数据
+            # 渲染课表数据（由 apply_cells 整体替换模型数据并重建合并单元格）
             self.render_schedule(schedule_data, manual_data)
                     
         except Exception as e:
@@ -6,16 +6,19 @@
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox, 
-    QLineEdit, QCheckBox, QPushButton, QLabel, 
-    QComboBox, QMessageBox
+    QLineEdit, QPushButton, QLabel, 
+    QComboBox, QMessageBox, QListView, QCompleter
 )
-from PySide6.QtCore import Qt
-import os
+from PySide6.QtCore import Qt, QTimer
+import configparser
 from core.log import get_logger
 from core.plugins.plugin_manager import get_plugin_manager
 
 logger = get_logger()
 
+# 连续点击“刷新”按钮时，只在最后一次点击后等待该时长再执行刷新
+REFRESH_DEBOUNCE_MS = 300
+
 
 class BasicTab(QWidget):
     """基础设置标签页类"""
@@ -24,8 +27,17 @@ class BasicTab(QWidget):
         super().__init__(parent)
         self.config_manager = config_manager
         self.plugin_manager = get_plugin_manager()
-        # 防止刷新时触发选择变化事件的标志
-        self.refresh_in_progress = False
+        # 院校代码 -> 下拉框索引，随插件列表一同重建
+        self._code_to_index = {}
+        # 下拉框当前展示的插件 {代码: 名称}，None 表示尚未填充
+        self._current_plugins = None
+        # 刷新进行中再次请求刷新时只记录标记，当前刷新结束后合并执行一次
+        self._refresh_running = False
+        self._refresh_pending = False
+        # 用户修改过的字段，保存时只写回这些字段；全部未修改时不做任何写入
+        self._dirty = {'username': False, 'password': False, 'school_code': False}
+        # 配置中已保存的院校代码；下拉框当前选择与之不同时（如首次使用或原插件已卸载）同样需要保存
+        self._saved_school_code = ''
         self.init_ui()
         
     def init_ui(self):
@@ -41,31 +53,52 @@ class BasicTab(QWidget):
         self.school_selector_combo = QComboBox()
         self.school_selector_combo.setMinimumWidth(200)
         
+        # 下拉列表按批布局、统一行高，插件较多时不必一次测量所有项
+        school_list_view = QListView()
+        school_list_view.setUniformItemSizes(True)
+        school_list_view.setLayoutMode(QListView.Batched)
+        school_list_view.setBatchSize(50)
+        self.school_selector_combo.setView(school_list_view)
+        
+        # 可输入院校代码或名称的任意部分进行筛选，输入内容不会作为新项插入
+        self.school_selector_combo.setEditable(True)
+        self.school_selector_combo.setInsertPolicy(QComboBox.NoInsert)
+        school_completer = QCompleter(self.school_selector_combo.model(), self.school_selector_combo)
+        school_completer.setFilterMode(Qt.MatchContains)
+        school_completer.setCaseSensitivity(Qt.CaseInsensitive)
+        school_completer.setCompletionMode(QCompleter.PopupCompletion)
+        self.school_selector_combo.setCompleter(school_completer)
+        
         # 院校选择布局
         school_hbox = QHBoxLayout()
         school_hbox.addWidget(self.school_selector_combo)
         
         # 添加刷新插件按钮
         self.refresh_plugins_btn = QPushButton("刷新")
-        self.refresh_plugins_btn.clicked.connect(self.manual_refresh_plugins)
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self.manual_refresh_plugins)
+        self.refresh_plugins_btn.clicked.connect(lambda: self._refresh_timer.start(REFRESH_DEBOUNCE_MS))
         school_hbox.addWidget(self.refresh_plugins_btn)
         
         school_hbox.addStretch()
         
-        # 添加监听器，当用户选择院校时记录选择
-        self.school_selector_combo.currentTextChanged.connect(self.on_school_selected)
+        # 添加监听器，当用户选择院校时记录选择（activated 只由用户操作触发，输入筛选文本和程序填充不会触发）
+        self.school_selector_combo.activated.connect(self.on_school_selected)
         
         school_account_layout.addRow(self.school_selector_label, school_hbox)
         
         # 学号输入
         self.student_id_input = QLineEdit()
         self.student_id_input.setPlaceholderText("请输入学号")
+        self.student_id_input.textEdited.connect(lambda: self._mark_dirty('username'))
         school_account_layout.addRow("学号:", self.student_id_input)
         
         # 密码输入
         self.password_input = QLineEdit()
         self.password_input.setPlaceholderText("请输入密码")
         self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self.password_input.textEdited.connect(lambda: self._mark_dirty('password'))
 
         school_account_layout.addRow("密码:", self.password_input)
         
@@ -82,27 +115,39 @@ class BasicTab(QWidget):
         
         # 先加载配置获取院校代码
         self.load_config()
-        # 然后刷新院校列表并设置默认选择
-        self.refresh_available_plugins()
+        # 扫描插件需要执行各插件代码，等到本页首次显示并绘制之后再刷新院校列表并设置默认选择
+        self.school_selector_combo.addItem("加载中…", "")
+        self._plugins_loaded = False
+    
+    def showEvent(self, event):
+        """首次显示时才加载院校列表"""
+        super().showEvent(event)
+        if not self._plugins_loaded:
+            self._plugins_loaded = True
+            QTimer.singleShot(0, self.refresh_available_plugins)
     
 
     
-    def on_school_selected(self, text):
+    def on_school_selected(self, index):
         """当用户选择院校时调用此方法"""
-        # 如果正在刷新，则不执行任何操作，避免无限循环
-        if self.refresh_in_progress:
-            return
         # 记录用户当前选择
-        self._current_selection = self.school_selector_combo.currentData()
-        logger.info(f"用户选择了院校: {text}, 代码: {self._current_selection}")
+        combo = self.school_selector_combo
+        self._current_selection = combo.itemData(index)
+        self._mark_dirty('school_code')
+        logger.info(f"用户选择了院校: {combo.itemText(index)}, 代码: {self._current_selection}")
+    
+    def _mark_dirty(self, field):
+        """记录用户修改过的字段（textEdited / activated 只由用户操作触发）"""
+        self._dirty[field] = True
     
     def manual_refresh_plugins(self):
         """手动刷新已安装的插件列表"""
         logger.info("用户手动刷新已安装插件列表")
+        self.refresh_plugins_btn.setEnabled(False)
         try:
-            # 清除插件索引缓存
-            logger.debug("清除插件索引缓存")
-            self.plugin_manager.clear_plugins_index_cache()
+            # 只清除已安装插件列表缓存（本页不使用远程插件索引，无需清除索引缓存）
+            logger.debug("清除已安装插件列表缓存")
+            self.plugin_manager.clear_available_plugins_cache()
             
             # 刷新已安装插件列表
             self.refresh_available_plugins()
@@ -111,129 +156,140 @@ class BasicTab(QWidget):
         except Exception as e:
             logger.error(f"手动刷新插件列表失败: {e}", exc_info=True)
             QMessageBox.critical(self, "错误", f"刷新已安装院校列表失败: {str(e)}")
+        finally:
+            self.refresh_plugins_btn.setEnabled(True)
     
     def refresh_available_plugins(self):
         """刷新可用插件列表并设置默认选择"""
+        if self._refresh_running:
+            # 例如错误提示框的事件循环中再次触发了刷新
+            self._refresh_pending = True
+            return
+        self._refresh_running = True
+        combo = self.school_selector_combo
+        # 填充期间屏蔽信号，避免每添加一项都触发选择变化事件和重新布局
+        combo.blockSignals(True)
         try:
-            # 设置刷新标志，防止在此期间触发选择变化事件
-            self.refresh_in_progress = True
-            
-            # 强制刷新插件索引，确保获取最新数据
-            self.plugin_manager.clear_plugins_index_cache()
-            
-            # 只获取已安装的插件
-            available_plugins = self.plugin_manager.get_available_plugins()
+            # 只获取已安装的插件（插件目录未变化时复用缓存，手动刷新会清除缓存）
+            available_plugins = self.plugin_manager.get_available_plugins_cached()
             
-            self.school_selector_combo.clear()
+            # 插件列表与下拉框当前内容一致时不做任何修改，保留用户当前的选择
+            if available_plugins == self._current_plugins:
+                logger.debug("可用插件列表未变化，跳过刷新")
+                return
             
             # 如果没有可用插件，至少添加一个占位选项
             if not available_plugins:
-                self.school_selector_combo.addItem("暂无可用院校插件，请前往插件管理页面下载", "")
+                combo.clear()
+                combo.addItem("暂无可用院校插件，请前往插件管理页面下载", "")
+                self._code_to_index = {}
+                self._current_plugins = {}
                 logger.warning("未找到任何可用插件")
+                return
+            
+            if not self._current_plugins:
+                # 首次填充（或替换占位选项）时整体重建
+                combo.clear()
+                codes = list(available_plugins)
+                combo.addItems([f"{code} - {available_plugins[code]}" for code in codes])
+                for i, code in enumerate(codes):
+                    combo.setItemData(i, code)
+                target_code = self._saved_school_code
             else:
+                # 增量更新：只移除已卸载的插件、更新改名的项、追加新安装的插件
+                target_code = combo.currentData()
+                for i in range(combo.count() - 1, -1, -1):
+                    code = combo.itemData(i)
+                    if code not in available_plugins:
+                        combo.removeItem(i)
+                    elif available_plugins[code] != self._current_plugins.get(code):
+                        combo.setItemText(i, f"{code} - {available_plugins[code]}")
                 for code, name in available_plugins.items():
-                    self.school_selector_combo.addItem(f"{code} - {name}", code)
-                logger.info(f"刷新可用插件列表，共找到 {len(available_plugins)} 个插件")
-                
-                # 设置配置文件中保存的默认选择
-                if hasattr(self, '_saved_school_code') and self._saved_school_code:
-                    index = self.school_selector_combo.findData(self._saved_school_code)
-                    if index >= 0:
-                        self.school_selector_combo.setCurrentIndex(index)
-                        logger.info(f"设置默认院校选择: {self._saved_school_code}")
-                    else:
-                        logger.warning(f"配置文件中的院校代码 {self._saved_school_code} 在插件列表中未找到")
+                    if code not in self._current_plugins:
+                        combo.addItem(f"{code} - {name}", code)
+                if target_code not in available_plugins:
+                    target_code = self._saved_school_code
+            
+            self._current_plugins = available_plugins
+            self._code_to_index = {combo.itemData(i): i for i in range(combo.count())}
+            logger.info(f"刷新可用插件列表，共找到 {len(available_plugins)} 个插件")
+            
+            # 恢复之前的选择，或设置配置文件中保存的默认选择
+            if target_code:
+                index = self._code_to_index.get(target_code, -1)
+                if index >= 0:
+                    combo.setCurrentIndex(index)
+                    logger.info(f"设置默认院校选择: {target_code}")
+                else:
+                    logger.warning(f"配置文件中的院校代码 {target_code} 在插件列表中未找到")
                 
         except Exception as e:
             logger.error(f"刷新可用插件列表失败: {e}", exc_info=True)
             QMessageBox.critical(self, "错误", f"刷新可用插件列表失败: {str(e)}")
         finally:
-            # 重置刷新标志
-            self.refresh_in_progress = False
+            combo.blockSignals(False)
+            self._refresh_running = False
+            if self._refresh_pending:
+                self._refresh_pending = False
+                QTimer.singleShot(0, self.refresh_available_plugins)
     
     def load_config(self):
-        """加载配置"""
+        """
+        加载配置
+        
+        config_manager 为配置窗口启动时解析一次的 ConfigParser，各标签页共享同一对象，
+        这里只从内存读取，不会重新读取或解析配置文件
+        """
         if self.config_manager:
-            # 检查是否是ConfigParser实例
-            if hasattr(self.config_manager, 'get'):
-                config = self.config_manager
-                # 加载学号
-                try:
-                    student_id = config.get('account', 'username', fallback='')
-                    self.student_id_input.setText(student_id)
-                except:
-                    pass
-                
-                # 加载密码
-                try:
-                    password = config.get('account', 'password', fallback='')
-                    self.password_input.setText(password)
-                except:
-                    pass
-                
-                # 加载学校代码（暂存，稍后在refresh_available_plugins中设置）
-                try:
-                    self._saved_school_code = config.get('account', 'school_code', fallback='')
-                    if self._saved_school_code:
-                        logger.info(f"读取到配置文件中的院校代码: {self._saved_school_code}")
-                except Exception as e:
-                    logger.error(f"读取学校代码配置失败: {e}")
-                    self._saved_school_code = ''
-            else:
-                # 如果是字典类型的配置
-                config = self.config_manager if isinstance(self.config_manager, dict) else {}
-                
-                # 加载学号
-                student_id = config.get('account', {}).get('username', '')
-                self.student_id_input.setText(student_id)
-                
-                # 加载密码
-                password = config.get('account', {}).get('password', '')
-                self.password_input.setText(password)
-                
-                # 加载学校代码（暂存，稍后在refresh_available_plugins中设置）
-                self._saved_school_code = config.get('account', {}).get('school_code', '')
-                if self._saved_school_code:
-                    logger.info(f"读取到配置文件中的院校代码: {self._saved_school_code}")
+            config = self.config_manager
+            # 一次性取出 account 段为普通字典，后续字段直接按键读取
+            try:
+                acct = dict(config.items('account')) if config.has_section('account') else {}
+            except configparser.Error as e:
+                logger.error(f"读取账户配置失败: {e}")
+                acct = {}
+            
+            # 加载学号和密码（界面内容与配置一致，清除修改标记）
+            self._dirty = dict.fromkeys(self._dirty, False)
+            self.student_id_input.setText(acct.get('username', ''))
+            self.password_input.setText(acct.get('password', ''))
+            
+            # 加载学校代码（暂存，稍后在refresh_available_plugins中设置）
+            self._saved_school_code = acct.get('school_code', '')
+            if self._saved_school_code:
+                logger.info(f"读取到配置文件中的院校代码: {self._saved_school_code}")
             
             logger.info("配置加载完成")
     
     def save_config(self):
-        """保存基本配置到配置管理器"""
+        """保存基本配置到配置管理器（共享的 ConfigParser 对象）"""
         if self.config_manager:
-            # 检查是否是ConfigParser实例
-            if hasattr(self.config_manager, 'set'):
-                config = self.config_manager
-                # 确保存在所需的section
-                if not config.has_section('account'):
-                    config.add_section('account')
-                
-                # 保存学号
-                config.set('account', 'username', self.student_id_input.text())
-                
-                # 保存密码
-                config.set('account', 'password', self.password_input.text())
-                
-                # 保存学校代码
-                school_code = self.school_selector_combo.currentData()
-                if school_code:
-                    config.set('account', 'school_code', school_code)
-                
-                logger.info("基本配置已保存")
-            else:
-                # 如果是字典类型的配置
-                if 'account' not in self.config_manager:
-                    self.config_manager['account'] = {}
-                
-                # 保存学号
-                self.config_manager['account']['username'] = self.student_id_input.text()
-                
-                # 保存密码
-                self.config_manager['account']['password'] = self.password_input.text()
-                
-                # 保存学校代码
-                school_code = self.school_selector_combo.currentData()
-                if school_code:
-                    self.config_manager['account']['school_code'] = school_code
-                
-                logger.info("基本配置已保存")
\ No newline at end of file
+            dirty = dict(self._dirty)
+            school_code = self.school_selector_combo.currentData()
+            if school_code and school_code != self._saved_school_code:
+                dirty['school_code'] = True
+            if not any(dirty.values()):
+                logger.debug("基本配置未修改，跳过保存")
+                return
+            
+            config = self.config_manager
+            # 确保存在所需的section，之后通过同一个段代理对象写入各字段
+            if not config.has_section('account'):
+                config.add_section('account')
+            account = config['account']
+            
+            # 保存学号
+            if dirty['username']:
+                account['username'] = self.student_id_input.text()
+            
+            # 保存密码
+            if dirty['password']:
+                account['password'] = self.password_input.text()
+            
+            # 保存学校代码
+            if dirty['school_code'] and school_code:
+                account['school_code'] = school_code
+                self._saved_school_code = school_code
+            
+            self._dirty = dict.fromkeys(dirty, False)
+            logger.info("基本配置已保存")
\ No newline at end of file
@@ -9,10 +9,11 @@ from PySide6.QtWidgets import (
     QPushButton, QLabel, QComboBox, QTextEdit, QFileDialog,
     QMessageBox, QProgressBar, QTabWidget, QScrollArea
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QObject, QThread
+from PySide6.QtCore import Qt, QTimer, Signal, QObject, QThread, QRunnable, QThreadPool
 from PySide6.QtGui import QPixmap
 import base64
 import json
+from datetime import datetime
 from pathlib import Path
 
 # 导入日志模块
@@ -36,6 +37,27 @@ except ImportError as e:
     logger.error(f"导入数据传输模块失败: {e}")
 
 
+class ExportSignals(QObject):
+    """导出任务的信号载体（QRunnable 本身不能定义信号）"""
+    finished = Signal(dict)  # export_full_data 的返回结果
+
+
+class ExportRunnable(QRunnable):
+    """在全局线程池中执行完整数据导出，避免文件读写阻塞界面"""
+    
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = ExportSignals()
+        
+    def run(self):
+        try:
+            result = export_full_data(self.file_path)
+        except Exception as e:
+            result = {"status": "error", "message": str(e)}
+        self.signals.finished.emit(result)
+
+
 class NetworkServerThread(QThread):
     """网络服务器线程"""
     status_changed = Signal(dict)
@@ -71,6 +93,7 @@ class DataTransferTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.server_thread = None
+        self._export_runnable = None
         self.init_ui()
         
     def init_ui(self):
@@ -249,11 +272,12 @@ class DataTransferTab(QWidget):
             # 固定导出完整数据
             export_type = "full"
             
-            # 选择保存文件
+            # 选择保存文件（预设带时间戳的绝对路径，避免对话框枚举当前工作目录）
+            default_path = str(Path.home() / f"capture_push_complete_{datetime.now():%Y%m%d_%H%M%S}.json")
             file_path, _ = QFileDialog.getSaveFileName(
                 self,
                 "保存完整数据文件",
-                f"capture_push_complete_{Path.cwd().name}.json",
+                default_path,
                 "JSON文件 (*.json)"
             )
             
@@ -261,27 +285,10 @@ class DataTransferTab(QWidget):
                 self.file_status_label.setText("正在导出...")
                 self.export_button.setEnabled(False)
                 
-                # 执行导出
-                # 直接调用export_full_data以使用用户选择的文件路径
-                result = export_full_data(file_path)
-                
-                if result.get("status") == "success":
-                    QMessageBox.information(
-                        self,
-                        "导出成功",
-                        f"数据已成功导出到:\n{result.get('file_path')}"
-                    )
-                    self.file_status_label.setText("导出完成")
-                    self.refresh_recent_files()
-                else:
-                    QMessageBox.critical(
-                        self,
-                        "导出失败",
-                        f"导出失败: {result.get('message', '未知错误')}"
-                    )
-                    self.file_status_label.setText("导出失败")
-                
-                self.export_button.setEnabled(True)
+                # 在线程池中执行导出，完成后由 on_export_finished 处理结果
+                self._export_runnable = ExportRunnable(file_path)
+                self._export_runnable.signals.finished.connect(self.on_export_finished)
+                QThreadPool.globalInstance().start(self._export_runnable)
                 
         except Exception as e:
             logger.error(f"文件导出出错: {e}")
@@ -289,6 +296,27 @@ class DataTransferTab(QWidget):
             self.file_status_label.setText("导出出错")
             self.export_button.setEnabled(True)
             
+    def on_export_finished(self, result):
+        """导出任务结束后的回调（在界面线程执行）"""
+        self._export_runnable = None
+        if result.get("status") == "success":
+            QMessageBox.information(
+                self,
+                "导出成功",
+                f"数据已成功导出到:\n{result.get('file_path')}"
+            )
+            self.file_status_label.setText("导出完成")
+            self.refresh_recent_files()
+        else:
+            QMessageBox.critical(
+                self,
+                "导出失败",
+                f"导出失败: {result.get('message', '未知错误')}"
+            )
+            self.file_status_label.setText("导出失败")
+        
+        self.export_button.setEnabled(True)
+            
     def browse_export_directory(self):
         """浏览导出目录"""
         try:
@@ -4,23 +4,158 @@
 """
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-    QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox, QMenu,
+    QTableView, QHeaderView, QMessageBox, QMenu,
     QLabel, QLineEdit
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import (
+    Qt, QThread, QTimer, Signal, QObject, QRunnable, QThreadPool,
+    QAbstractTableModel, QModelIndex
+)
 import logging
+import re
+import shutil
+import functools
 from core.plugins.plugin_manager import get_plugin_manager
 
 logger = logging.getLogger(__name__)
 
+# 并发检查单个插件更新时使用的最大线程数
+MAX_UPDATE_CHECK_THREADS = 16
+
+# 搜索框停止输入该时长后才执行过滤
+FILTER_DEBOUNCE_MS = 150
+
+PLUGIN_TABLE_HEADERS = ['院校代码', '院校名称', '当前版本', '最新版本', '贡献者']
+# 各列对应插件数据中的键
+PLUGIN_TABLE_KEYS = ('code', 'name', 'current_version', 'latest_version', 'contributor')
+COL_CODE, COL_NAME, COL_CURRENT, COL_LATEST, COL_CONTRIBUTOR = range(len(PLUGIN_TABLE_HEADERS))
+
+
+class PluginTableModel(QAbstractTableModel):
+    """插件列表模型：直接引用插件数据字典列表，文本在绘制时按需读取"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._plugins = []
+        self._row_by_code = {}
+
+    def set_plugins(self, plugins):
+        """整体替换插件数据（不复制，模型与调用方共享同一批字典）"""
+        self.beginResetModel()
+        self._plugins = plugins
+        self._row_by_code = {plugin['code']: i for i, plugin in enumerate(plugins)}
+        self.endResetModel()
+
+    def codes(self):
+        return [plugin['code'] for plugin in self._plugins]
+
+    def plugin(self, code):
+        """按院校代码获取插件数据字典，不存在时返回 None"""
+        row = self._row_by_code.get(code)
+        return None if row is None else self._plugins[row]
+
+    def value(self, row, col):
+        return self._plugins[row].get(PLUGIN_TABLE_KEYS[col], '-')
+
+    def update_plugin(self, code, values):
+        """按院校代码更新插件数据中的若干字段 {键: 文本} 并刷新该行，不在列表中时忽略"""
+        row = self._row_by_code.get(code)
+        if row is None:
+            return
+        self._plugins[row].update(values)
+        cols = [PLUGIN_TABLE_KEYS.index(key) for key in values]
+        self.dataChanged.emit(self.index(row, min(cols)), self.index(row, max(cols)))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._plugins)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(PLUGIN_TABLE_HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role == Qt.DisplayRole:
+            return self.value(index.row(), index.column())
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return PLUGIN_TABLE_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        # 只读
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+
+@functools.lru_cache(maxsize=32)
+def compile_search_pattern(search_text):
+    """编译忽略大小写的搜索正则，无效正则返回 None（结果按搜索文本缓存）"""
+    try:
+        return re.compile(search_text, re.IGNORECASE)
+    except re.error:
+        return None
+
+
+def collect_plugins_data(plugin_manager):
+    """
+    合并插件索引和已安装插件，生成插件列表数据（在后台线程调用，当前版本也一并读取）
+    
+    Returns:
+        [{'code', 'name', 'contributor', 'latest_version', 'current_version', 'code_lc', 'name_lc'}, ...]
+    """
+    all_plugins = {}
+    plugins_index = plugin_manager._fetch_plugins_index()
+    if plugins_index and isinstance(plugins_index, dict):
+        plugins_list = plugins_index.get('plugins', [])
+        logger.info(f"从插件索引获取到 {len(plugins_list)} 个插件")
+        for plugin in plugins_list:
+            school_code = plugin.get('school_code')
+            if school_code:
+                all_plugins[school_code] = {
+                    'code': school_code,
+                    'name': plugin.get('school_name', school_code),
+                    'contributor': plugin.get('contributor', 'Unknown'),
+                    'latest_version': plugin.get('plugin_version', '-')
+                }
+    else:
+        logger.warning("无法获取插件索引或插件索引为空")
+    
+    # 同时获取已安装的插件
+    installed_plugins = plugin_manager.get_available_plugins_cached()
+    logger.info(f"已安装插件数量: {len(installed_plugins)}")
+    for code, name in installed_plugins.items():
+        if code not in all_plugins:
+            all_plugins[code] = {
+                'code': code,
+                'name': name,
+                'contributor': 'Unknown',
+                'latest_version': '-'  # 本地插件的最新版本需要单独检查
+            }
+    
+    logger.info(f"合并后插件总数: {len(all_plugins)}")
+    
+    # 当前版本 - 一次遍历插件目录取得所有本地版本，界面线程显示时不再访问磁盘
+    local_versions = plugin_manager.get_all_local_versions()
+    for code, plugin in all_plugins.items():
+        current_version = local_versions.get(code, "0.0.0")
+        plugin['current_version'] = current_version if current_version != "0.0.0" else "未安装"
+        # 预先转为小写，搜索时子字符串匹配不必逐行转换
+        plugin['code_lc'] = code.lower()
+        plugin['name_lc'] = plugin['name'].lower()
+    return list(all_plugins.values())
+
 
 class PluginManagementTab(QWidget):
     def __init__(self, parent=None, config_manager=None):
         super().__init__(parent)
         self.config_manager = config_manager
         self.plugin_manager = get_plugin_manager()
-        # 防止重复点击的标志
-        self.operation_in_progress = False
+        # 正在执行的后台加载 / 检查更新任务
+        self._load_runnable = None
+        self._check_runnable = None
+        # 正在执行的单个插件操作 {院校代码: 任务}，防止同一插件重复操作
+        self._plugin_operations = {}
+        # 正在并发检查更新的插件 {院校代码: 任务}
+        self._pending_update_checks = {}
         logger.info("PluginManagementTab 初始化")
         self.init_ui()
 
@@ -32,16 +167,21 @@ class PluginManagementTab(QWidget):
         search_label = QLabel('搜索:')
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText('输入院校代码或院校名称进行搜索')
-        self.search_input.textChanged.connect(self.filter_plugins)
+        # 连续输入时只在最后一次按键后过滤一次（单次定时器重复 start 会重新计时）
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self.filter_plugins)
+        self.search_input.textChanged.connect(self._filter_timer.start)
         search_layout.addWidget(search_label)
         search_layout.addWidget(self.search_input)
         
         layout.addLayout(search_layout)
 
-        # 创建表格
-        self.plugin_table = QTableWidget()
-        self.plugin_table.setColumnCount(5)  # 院校代码、院校名称、当前版本、最新版本、贡献者
-        self.plugin_table.setHorizontalHeaderLabels(['院校代码', '院校名称', '当前版本', '最新版本', '贡献者'])
+        # 创建表格（院校代码、院校名称、当前版本、最新版本、贡献者）
+        self.plugin_model = PluginTableModel(self)
+        self.plugin_table = QTableView()
+        self.plugin_table.setModel(self.plugin_model)
         header = self.plugin_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
         
@@ -68,34 +208,37 @@ class PluginManagementTab(QWidget):
         # 连接信号
         self.check_update_btn.clicked.connect(self.check_updates)
         
-        # 自动加载插件列表
-        self.original_plugins_data = []  # 存储原始插件数据
-        self.auto_load_plugins()
+        # 插件列表在本页首次显示时自动加载
+        self.original_plugins_data = []  # 存储原始插件数据（表格模型直接引用）
+        self._plugins_loaded = False
         
         logger.info("PluginManagementTab UI 初始化完成")
 
+    def showEvent(self, event):
+        """首次显示时才自动加载插件列表"""
+        super().showEvent(event)
+        if not self._plugins_loaded:
+            self._plugins_loaded = True
+            self.auto_load_plugins()
+
     def show_context_menu(self, position):
         """显示右键菜单"""
         logger.debug(f"右键菜单被触发，位置: {position}")
-        item = self.plugin_table.currentItem()
-        if item is None:
+        index = self.plugin_table.currentIndex()
+        if not index.isValid():
             logger.warning("右键菜单：未选中任何项目")
             return
         
-        row = item.row()
-        code_item = self.plugin_table.item(row, 0)
-        if code_item is None:
-            logger.warning(f"右键菜单：无法获取第 {row} 行的院校代码")
-            return
-        
-        school_code = code_item.text()
+        row = index.row()
+        school_code = self.plugin_model.value(row, COL_CODE)
         logger.info(f"右键菜单：选中院校代码 {school_code}")
         
         menu = QMenu()
+        # 该插件已有操作在后台执行时禁用所有菜单项
+        busy = school_code in self._plugin_operations
         
         # 获取当前版本信息
-        current_version_item = self.plugin_table.item(row, 2)
-        current_version = current_version_item.text() if current_version_item else ""
+        current_version = self.plugin_model.value(row, COL_CURRENT)
         
         logger.debug(f"院校 {school_code} 当前版本: {current_version}")
         
@@ -103,28 +246,30 @@ class PluginManagementTab(QWidget):
         if current_version == "未安装":
             logger.debug(f"为未安装的插件 {school_code} 添加安装选项")
             install_action = menu.addAction('安装插件')
+            install_action.setEnabled(not busy)
             install_action.triggered.connect(lambda: self.install_plugin(school_code))
         else:
             logger.debug(f"为已安装的插件 {school_code} 添加卸载选项")
             uninstall_action = menu.addAction('卸载插件')
+            uninstall_action.setEnabled(not busy)
             uninstall_action.triggered.connect(lambda: self.uninstall_plugin(school_code))
             
             # 检查更新选项
             logger.debug(f"为插件 {school_code} 添加检查更新选项")
             update_action = menu.addAction('检查此插件更新')
+            update_action.setEnabled(not busy)
             update_action.triggered.connect(lambda: self.check_single_plugin_update(school_code))
 
         menu.exec_(self.plugin_table.viewport().mapToGlobal(position))
         logger.debug("右键菜单执行完毕")
 
     def install_plugin(self, school_code):
-        """安装插件"""
+        """安装插件（下载安装在后台线程执行）"""
         # 防止重复点击
-        if self.operation_in_progress:
+        if school_code in self._plugin_operations:
             logger.info(f"插件 {school_code} 操作已在进行中，忽略重复点击")
             return
         
-        self.operation_in_progress = True
         logger.info(f"开始安装插件 {school_code}")
         
         # 检查本地是否已存在插件
@@ -134,483 +279,303 @@ class PluginManagementTab(QWidget):
                                        QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
             if reply == QMessageBox.No:
                 logger.info(f"用户取消重新安装插件 {school_code}")
-                self.operation_in_progress = False
                 return
         
-        try:
-            # 检查是否有更新
-            update_info = self.plugin_manager.check_plugin_update(school_code)
-            if update_info:
-                logger.info(f"找到 {school_code} 的更新信息，开始下载安装")
-                success = self.plugin_manager.download_and_install_plugin(school_code, update_info)
-                if success:
-                    logger.info(f"院校 {school_code} 插件安装成功")
-                    QMessageBox.information(self, '成功', f'院校 {school_code} 插件安装成功')
-                    # 刷新当前行的版本信息
-                    self.refresh_single_row(school_code)
-                else:
-                    logger.error(f"院校 {school_code} 插件安装失败")
-                    QMessageBox.critical(self, '错误', f'院校 {school_code} 插件安装失败')
-            else:
-                logger.info(f"未找到 {school_code} 的更新信息，尝试直接从索引安装")
-                # 如果没有更新信息，尝试直接安装
-                plugin_info = self.plugin_manager.get_plugin_info_from_index(school_code)
-                if plugin_info:
-                    success = self.plugin_manager.download_and_install_plugin(school_code, plugin_info)
-                    if success:
-                        logger.info(f"院校 {school_code} 插件安装成功")
-                        QMessageBox.information(self, '成功', f'院校 {school_code} 插件安装成功')
-                        self.refresh_single_row(school_code)
-                    else:
-                        logger.error(f"院校 {school_code} 插件安装失败")
-                        QMessageBox.critical(self, '错误', f'院校 {school_code} 插件安装失败')
-                else:
-                    logger.warning(f"未找到院校 {school_code} 的插件信息")
-                    QMessageBox.warning(self, '警告', f'未找到院校 {school_code} 的插件信息')
-        except Exception as e:
-            logger.error(f"安装插件 {school_code} 时发生错误: {str(e)}", exc_info=True)
-            QMessageBox.critical(self, '错误', f'安装插件时发生错误: {str(e)}')
-        finally:
-            self.operation_in_progress = False
+        self._start_plugin_install(school_code, None, '安装')
+    
+    def _start_plugin_install(self, school_code, plugin_info, action):
+        """在后台线程下载安装插件，plugin_info 为 None 时由后台任务查找安装信息"""
+        runnable = InstallPluginRunnable(self.plugin_manager, school_code, plugin_info, action)
+        runnable.signals.finished.connect(self.on_plugin_installed)
+        self._plugin_operations[school_code] = runnable
+        QThreadPool.globalInstance().start(runnable)
+    
+    def on_plugin_installed(self, school_code, success, error, plugin_info):
+        """插件下载安装完成后在界面线程中提示并刷新该行"""
+        runnable = self._plugin_operations.pop(school_code, None)
+        action = runnable.action if runnable is not None else '安装'
+        if success:
+            logger.info(f"院校 {school_code} 插件{action}成功")
+            QMessageBox.information(self, '成功', f'院校 {school_code} 插件{action}成功')
+            # 刷新当前行的版本信息（刚安装的版本即安装信息中的版本）
+            self.refresh_single_row(school_code, plugin_info.get('plugin_version', 'unknown'), plugin_info)
+        elif error:
+            logger.error(f"{action}插件 {school_code} 时发生错误: {error}")
+            QMessageBox.critical(self, '错误', f'{action}插件时发生错误: {error}')
+        elif plugin_info is None:
+            logger.warning(f"未找到院校 {school_code} 的插件信息")
+            QMessageBox.warning(self, '警告', f'未找到院校 {school_code} 的插件信息')
+        else:
+            logger.error(f"院校 {school_code} 插件{action}失败")
+            QMessageBox.critical(self, '错误', f'院校 {school_code} 插件{action}失败')
 
     def uninstall_plugin(self, school_code):
-        """卸载插件"""
+        """卸载插件（删除插件目录在后台线程执行）"""
         # 防止重复点击
-        if self.operation_in_progress:
+        if school_code in self._plugin_operations:
             logger.info(f"插件 {school_code} 操作已在进行中，忽略重复点击")
             return
         
-        self.operation_in_progress = True
         logger.info(f"开始卸载插件 {school_code}")
         reply = QMessageBox.question(self, '确认', f'确定要卸载院校 {school_code} 的插件吗？', 
                                    QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
-        if reply == QMessageBox.Yes:
-            logger.info(f"用户确认卸载插件 {school_code}")
-            try:
-                import shutil
-                from pathlib import Path
-                plugin_dir = self.plugin_manager.plugins_dir / school_code
-                if plugin_dir.exists():
-                    logger.info(f"删除插件目录: {plugin_dir}")
-                    shutil.rmtree(plugin_dir)
-                    logger.info(f"院校 {school_code} 插件卸载成功")
-                    QMessageBox.information(self, '成功', f'院校 {school_code} 插件卸载成功')
-                    # 刷新当前行的版本信息
-                    self.refresh_single_row(school_code)
-                else:
-                    logger.warning(f"院校 {school_code} 插件目录不存在: {plugin_dir}")
-                    QMessageBox.warning(self, '警告', f'院校 {school_code} 插件不存在')
-            except Exception as e:
-                logger.error(f"卸载插件 {school_code} 时发生错误: {str(e)}", exc_info=True)
-                QMessageBox.critical(self, '错误', f'卸载插件时发生错误: {str(e)}')
-            finally:
-                self.operation_in_progress = False
-        else:
+        if reply != QMessageBox.Yes:
             logger.info(f"用户取消卸载插件 {school_code}")
-            self.operation_in_progress = False
+            return
+        
+        logger.info(f"用户确认卸载插件 {school_code}")
+        plugin_dir = self.plugin_manager.plugins_dir / school_code
+        if not plugin_dir.exists():
+            logger.warning(f"院校 {school_code} 插件目录不存在: {plugin_dir}")
+            QMessageBox.warning(self, '警告', f'院校 {school_code} 插件不存在')
+            return
+        
+        logger.info(f"删除插件目录: {plugin_dir}")
+        runnable = UninstallPluginRunnable(school_code, plugin_dir)
+        runnable.signals.finished.connect(self.on_plugin_uninstalled)
+        self._plugin_operations[school_code] = runnable
+        QThreadPool.globalInstance().start(runnable)
+    
+    def on_plugin_uninstalled(self, school_code, success, error):
+        """插件目录删除完成后在界面线程中更新缓存和表格"""
+        self._plugin_operations.pop(school_code, None)
+        # 无论是否完全删除成功，插件目录都可能已变化
+        self.plugin_manager.invalidate_local_plugin_version(school_code)
+        self.plugin_manager.clear_available_plugins_cache()
+        if success:
+            logger.info(f"院校 {school_code} 插件卸载成功")
+            QMessageBox.information(self, '成功', f'院校 {school_code} 插件卸载成功')
+            version_display = "未安装"
+        else:
+            logger.error(f"卸载插件 {school_code} 时发生错误: {error}")
+            QMessageBox.critical(self, '错误', f'卸载插件时发生错误: {error}')
+            # 目录可能只删除了一部分，重新读取本地版本（只读本地文件）
+            current_version = self.plugin_manager._get_local_plugin_version(school_code)
+            version_display = current_version if current_version != "0.0.0" else "未安装"
+        # 卸载只改变当前版本，最新版本和贡献者保持不变，无需再查询插件索引或网络
+        self.plugin_model.update_plugin(school_code, {'current_version': version_display})
 
     def check_single_plugin_update(self, school_code):
-        """检查单个插件更新"""
+        """检查单个插件更新（网络请求在后台线程执行）"""
         # 防止重复点击
-        if self.operation_in_progress:
+        if school_code in self._plugin_operations:
             logger.info(f"插件 {school_code} 操作已在进行中，忽略重复点击")
             return
         
-        self.operation_in_progress = True
         logger.info(f"检查单个插件 {school_code} 更新")
-        try:
+        runnable = SinglePluginCheckRunnable(self.plugin_manager, school_code)
+        runnable.signals.finished.connect(self.on_single_plugin_checked)
+        self._plugin_operations[school_code] = runnable
+        QThreadPool.globalInstance().start(runnable)
+    
+    def on_single_plugin_checked(self, school_code, success, error, update_info):
+        """单个插件更新检查完成后在界面线程中询问用户是否更新"""
+        self._plugin_operations.pop(school_code, None)
+        if not success:
+            logger.error(f"检查插件 {school_code} 更新时发生错误: {error}")
+            QMessageBox.critical(self, '错误', f'检查更新时发生错误: {error}')
+            return
+        if not update_info:
+            logger.warning(f"未找到院校 {school_code} 的更新信息")
+            QMessageBox.information(self, '提示', f'未找到院校 {school_code} 的更新信息')
+            return
+        
+        remote_version = update_info.get('remote_version', '-')
+        current_version = self.plugin_manager._get_local_plugin_version(school_code)
+        
+        logger.info(f"院校 {school_code}: 当前版本 {current_version}, 最新版本 {remote_version}")
+        
+        if self.plugin_manager._compare_version(remote_version, current_version) > 0:
+            logger.info(f"院校 {school_code} 有新版本可用")
+            reply = QMessageBox.question(self, '更新可用', 
+                                       f'院校 {school_code} 有新版本可用\n'
+                                       f'当前版本: {current_version}\n'
+                                       f'最新版本: {remote_version}\n'
+                                       '是否更新？',
+                                       QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+            if reply == QMessageBox.Yes:
+                logger.info(f"用户同意更新插件 {school_code}")
+                self._start_plugin_install(school_code, update_info, '更新')
+            else:
+                logger.info(f"用户拒绝更新插件 {school_code}")
+        else:
+            logger.info(f"院校 {school_code} 插件已是最新版本")
+            QMessageBox.information(self, '提示', f'院校 {school_code} 插件已是最新版本')
+
+    def refresh_single_row(self, school_code, known_version=None, plugin_info=None):
+        """
+        刷新单行数据
+        
+        Args:
+            school_code: 院校代码
+            known_version: 已知的当前版本显示文本（刚安装/卸载后已确定），为 None 时从本地读取
+            plugin_info: 已知的插件信息（安装时使用的信息），为 None 时从插件索引获取
+        """
+        logger.debug("刷新单行数据: %s", school_code)
+        if self.plugin_model.plugin(school_code) is None:
+            return
+        
+        # 更新当前版本
+        if known_version is not None:
+            version_display = known_version
+        else:
+            current_version = self.plugin_manager._get_local_plugin_version(school_code)
+            version_display = current_version if current_version != "0.0.0" else "未安装"
+        
+        # 更新最新版本 - 从插件索引获取（本地索引文件变化时缓存自动失效）
+        if plugin_info is None:
+            plugin_info = self.plugin_manager.get_plugin_info_from_index(school_code)
+        if plugin_info and 'plugin_version' in plugin_info:
+            latest_version = plugin_info.get('plugin_version', '-')
+        else:
+            # 如果索引中没有，尝试检查更新
             update_info = self.plugin_manager.check_plugin_update(school_code)
             if update_info:
-                remote_version = update_info.get('remote_version', '-')
-                current_version = self.plugin_manager._get_local_plugin_version(school_code)
-                
-                logger.info(f"院校 {school_code}: 当前版本 {current_version}, 最新版本 {remote_version}")
-                
-                if self.plugin_manager._compare_version(remote_version, current_version) > 0:
-                    logger.info(f"院校 {school_code} 有新版本可用")
-                    reply = QMessageBox.question(self, '更新可用', 
-                                               f'院校 {school_code} 有新版本可用\n'
-                                               f'当前版本: {current_version}\n'
-                                               f'最新版本: {remote_version}\n'
-                                               '是否更新？',
-                                               QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
-                    if reply == QMessageBox.Yes:
-                        logger.info(f"用户同意更新插件 {school_code}")
-                        success = self.plugin_manager.download_and_install_plugin(school_code, update_info)
-                        if success:
-                            logger.info(f"院校 {school_code} 插件更新成功")
-                            QMessageBox.information(self, '成功', f'院校 {school_code} 插件更新成功')
-                            self.refresh_single_row(school_code)
-                        else:
-                            logger.error(f"院校 {school_code} 插件更新失败")
-                            QMessageBox.critical(self, '错误', f'院校 {school_code} 插件更新失败')
-                    else:
-                        logger.info(f"用户拒绝更新插件 {school_code}")
-                else:
-                    logger.info(f"院校 {school_code} 插件已是最新版本")
-                    QMessageBox.information(self, '提示', f'院校 {school_code} 插件已是最新版本')
+                latest_version = update_info.get('remote_version', '-')
             else:
-                logger.warning(f"未找到院校 {school_code} 的更新信息")
-                QMessageBox.information(self, '提示', f'未找到院校 {school_code} 的更新信息')
-        except Exception as e:
-            logger.error(f"检查插件 {school_code} 更新时发生错误: {str(e)}", exc_info=True)
-            QMessageBox.critical(self, '错误', f'检查更新时发生错误: {str(e)}')
-        finally:
-            self.operation_in_progress = False
-
-    def refresh_single_row(self, school_code):
-        """刷新单行数据"""
-        logger.debug(f"刷新单行数据: {school_code}")
-        for row in range(self.plugin_table.rowCount()): 
-            code_item = self.plugin_table.item(row, 0)
-            if code_item and code_item.text() == school_code:
-                # 更新当前版本
-                current_version = self.plugin_manager._get_local_plugin_version(school_code)
-                current_ver_item = QTableWidgetItem(current_version if current_version != "0.0.0" else "未安装")
-                current_ver_item.setFlags(current_ver_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.plugin_table.setItem(row, 2, current_ver_item)
-                    
-                # 更新最新版本 - 强制从网络获取最新版本信息
-                # 首先清除缓存以确保获取最新数据
-                self.plugin_manager.clear_plugins_index_cache()
-                
-                # 从插件索引获取最新版本信息
-                plugin_info = self.plugin_manager.get_plugin_info_from_index(school_code)
-                if plugin_info and 'plugin_version' in plugin_info:
-                    latest_version = plugin_info.get('plugin_version', '-')
-                else:
-                    # 如果索引中没有，尝试检查更新
-                    update_info = self.plugin_manager.check_plugin_update(school_code)
-                    if update_info:
-                        latest_version = update_info.get('remote_version', '-')
-                    else:
-                        latest_version = '-'
-                latest_ver_item = QTableWidgetItem(latest_version)
-                latest_ver_item.setFlags(latest_ver_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.plugin_table.setItem(row, 3, latest_ver_item)
-                    
-                # 更新贡献者信息
-                if plugin_info and 'contributor' in plugin_info:
-                    contributor = plugin_info.get('contributor', 'Unknown')
-                else:
-                    contributor = 'Unknown'
-                contributor_item = QTableWidgetItem(contributor)
-                contributor_item.setFlags(contributor_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.plugin_table.setItem(row, 4, contributor_item)
-                    
-                logger.debug(f"已更新 {school_code} 的版本信息为: {current_version if current_version != '0.0.0' else '未安装'}，最新版本: {latest_version}，贡献者: {contributor}")
-                break
+                latest_version = '-'
+        
+        # 更新贡献者信息
+        if plugin_info and 'contributor' in plugin_info:
+            contributor = plugin_info.get('contributor', 'Unknown')
+        else:
+            contributor = 'Unknown'
+        
+        self.plugin_model.update_plugin(school_code, {
+            'current_version': version_display,
+            'latest_version': latest_version,
+            'contributor': contributor,
+        })
+        logger.debug("已更新 %s 的版本信息为: %s，最新版本: %s，贡献者: %s",
+                     school_code, version_display, latest_version, contributor)
 
     def refresh_plugins(self):
         """刷新插件列表（已弃用，使用auto_load_plugins替代）"""
-        logger.info("开始刷新插件列表")
-        try:
-            # 清除插件索引缓存，强制重新获取最新数据
-            logger.debug("清除插件索引缓存")
-            self.plugin_manager.clear_plugins_index_cache()
-            
-            # 获取所有可用插件（从索引文件）
-            all_plugins = {}
-            plugins_index = self.plugin_manager._fetch_plugins_index()
-            if plugins_index and isinstance(plugins_index, dict):
-                plugins_list = plugins_index.get('plugins', [])
-                logger.info(f"从插件索引获取到 {len(plugins_list)} 个插件")
-                for plugin in plugins_list:
-                    school_code = plugin.get('school_code')
-                    school_name = plugin.get('school_name', school_code)
-                    contributor = plugin.get('contributor', 'Unknown')
-                    if school_code:
-                        all_plugins[school_code] = {
-                            'name': school_name,
-                            'contributor': contributor
-                        }
-                        logger.debug(f"插件索引中找到: {school_code} - {school_name} - {contributor}")
-            else:
-                logger.warning("无法获取插件索引或插件索引为空")
-            
-            # 同时获取已安装的插件
-            installed_plugins = self.plugin_manager.get_available_plugins()
-            logger.info(f"已安装插件数量: {len(installed_plugins)}")
-            for code, name in installed_plugins.items():
-                logger.debug(f"已安装插件: {code} - {name}")
-                if code not in all_plugins:
-                    all_plugins[code] = {
-                        'name': name,
-                        'contributor': 'Unknown'
-                    }
-            
-            logger.info(f"合并后插件总数: {len(all_plugins)}")
-            
-            self.plugin_table.setRowCount(len(all_plugins))
-            
-            for row, (code, data) in enumerate(all_plugins.items()):
-                name = data['name']
-                contributor = data['contributor']
-                logger.debug(f"填充第 {row} 行: {code} - {name} - {contributor}")
-                # 院校代码
-                code_item = QTableWidgetItem(code)
-                code_item.setFlags(code_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.plugin_table.setItem(row, 0, code_item)
-                
-                # 院校名称
-                name_item = QTableWidgetItem(name)
-                name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.plugin_table.setItem(row, 1, name_item)
-                
-                # 当前版本 - 检查是否已安装
-                current_version = self.plugin_manager._get_local_plugin_version(code)
-                version_display = current_version if current_version != "0.0.0" else "未安装"
-                logger.debug(f"插件 {code} 当前版本: {version_display}")
-                current_ver_item = QTableWidgetItem(version_display)
-                current_ver_item.setFlags(current_ver_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.plugin_table.setItem(row, 2, current_ver_item)
-                
-                # 最新版本（暂时显示为未知，需要检查更新后才能知道）
-                latest_ver_item = QTableWidgetItem('-')
-                latest_ver_item.setFlags(latest_ver_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.plugin_table.setItem(row, 3, latest_ver_item)
-                
-                # 贡献者
-                contributor_item = QTableWidgetItem(contributor)
-                contributor_item.setFlags(contributor_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.plugin_table.setItem(row, 4, contributor_item)
-                
-            logger.info("插件列表刷新完成")
-        except Exception as e:
-            logger.error(f"刷新插件列表失败: {str(e)}", exc_info=True)
-            QMessageBox.critical(self, '错误', f'刷新插件列表失败: {str(e)}')
+        self.auto_load_plugins()
 
     def check_updates(self):
-        """检查插件更新（从网络获取最新JSON）"""
+        """检查插件更新（从网络获取最新JSON，在后台线程执行）"""
+        if self._check_runnable is not None or self._pending_update_checks:
+            logger.info("插件更新检查已在进行中，忽略重复点击")
+            return
         logger.info("开始检查所有插件更新（从网络获取最新数据）")
-        try:
-            # 调用插件管理器的更新方法，从网络下载最新的plugins_index.json文件
-            logger.debug("从网络更新插件索引文件")
-            success = self.plugin_manager.update_plugins_index()
-            if not success:
-                logger.warning("无法从网络更新插件索引文件")
-                QMessageBox.warning(self, '警告', '无法从网络更新插件索引文件，请检查网络连接')
-                return
-            
-            # 清除插件索引缓存，确保使用刚下载的新数据
-            logger.debug("清除插件索引缓存，使用新下载的数据")
-            self.plugin_manager.clear_plugins_index_cache()
-            
-            # 重新获取所有插件数据（从刚更新的本地JSON文件）
-            all_plugins = {}
-            plugins_index = self.plugin_manager._fetch_plugins_index()
-            if plugins_index and isinstance(plugins_index, dict):
-                plugins_list = plugins_index.get('plugins', [])
-                logger.info(f"从更新的JSON获取到 {len(plugins_list)} 个插件")
-                for plugin in plugins_list:
-                    school_code = plugin.get('school_code')
-                    school_name = plugin.get('school_name', school_code)
-                    contributor = plugin.get('contributor', 'Unknown')
-                    if school_code:
-                        all_plugins[school_code] = {
-                            'name': school_name,
-                            'contributor': contributor,
-                            'latest_version': plugin.get('plugin_version', '-')
-                        }
-                        logger.debug(f"更新的JSON中插件: {school_code} - {school_name} - {contributor} - {plugin.get('plugin_version', '-')}")
+        
+        self.check_update_btn.setEnabled(False)
+        self._check_runnable = CheckUpdatesRunnable(self.plugin_manager)
+        self._check_runnable.signals.finished.connect(self.on_updates_checked)
+        QThreadPool.globalInstance().start(self._check_runnable)
+    
+    def on_updates_checked(self, success, error, latest_info):
+        """插件索引更新完成后在界面线程中更新表格，索引中没有的插件并发单独检查"""
+        self._check_runnable = None
+        if not success:
+            self.check_update_btn.setEnabled(True)
+            logger.warning(f"检查更新失败: {error}")
+            QMessageBox.warning(self, '警告', error)
+            return
+        
+        # 遍历所有插件（包括被搜索条件隐藏的行），更新插件信息
+        missing_codes = []
+        for school_code in self.plugin_model.codes():
+            if school_code in latest_info:
+                self._set_row_latest_info(school_code, *latest_info[school_code])
             else:
-                logger.warning("无法从更新的JSON获取插件索引或插件索引为空")
-                QMessageBox.warning(self, '警告', '无法从更新的JSON获取插件索引，请检查网络连接')
-                return
-            
-            # 同时获取已安装的插件
-            installed_plugins = self.plugin_manager.get_available_plugins()
-            logger.info(f"已安装插件数量: {len(installed_plugins)}")
-            for code, name in installed_plugins.items():
-                logger.debug(f"已安装插件: {code} - {name}")
-                if code not in all_plugins:
-                    all_plugins[code] = {
-                        'name': name,
-                        'contributor': 'Unknown',
-                        'latest_version': '-'  # 本地插件的最新版本需要单独检查
-                    }
-            
-            logger.info(f"合并后插件总数: {len(all_plugins)}")
-            
-            # 遍历表格中的每一行，更新插件信息
-            for row in range(self.plugin_table.rowCount()): 
-                code_item = self.plugin_table.item(row, 0)
-                if code_item:
-                    school_code = code_item.text()
-                    logger.debug(f"更新第 {row} 行插件 {school_code} 的信息")
-                        
-                    # 更新最新版本 - 从刚更新的JSON数据
-                    if school_code in all_plugins:
-                        latest_version = all_plugins[school_code]['latest_version']
-                        contributor = all_plugins[school_code]['contributor']
-                    else:
-                        # 如果JSON数据中没有该插件，使用检查更新的方式获取
-                        update_info = self.plugin_manager.check_plugin_update(school_code)
-                        if update_info:
-                            latest_version = update_info.get('remote_version', '-')
-                            contributor = update_info.get('contributor', 'Unknown')
-                        else:
-                            latest_version = '-'
-                            contributor = 'Unknown'
-                    
-                    logger.info(f"插件 {school_code} 最新版本: {latest_version}")
-                    
-                    # 更新最新版本列
-                    latest_ver_item = QTableWidgetItem(latest_version)
-                    latest_ver_item.setFlags(latest_ver_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self.plugin_table.setItem(row, 3, latest_ver_item)
-                        
-                    # 更新贡献者列
-                    contributor_item = QTableWidgetItem(contributor)
-                    contributor_item.setFlags(contributor_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self.plugin_table.setItem(row, 4, contributor_item)
-                        
-            logger.info("插件更新检查完成（从网络获取数据）")
-            QMessageBox.information(self, '提示', '插件更新检查完成，已从网络更新 plugins_index.json 文件')
-        except Exception as e:
-            logger.error(f"检查更新失败: {str(e)}", exc_info=True)
-            QMessageBox.critical(self, '错误', f'检查更新失败: {str(e)}')
+                missing_codes.append(school_code)
+        
+        if not missing_codes:
+            self._finish_update_check()
+            return
+        
+        # JSON数据中没有的插件，每个插件一个任务并发调用 check_plugin_update
+        pool = QThreadPool.globalInstance()
+        thread_count = min(MAX_UPDATE_CHECK_THREADS, len(missing_codes))
+        if pool.maxThreadCount() < thread_count:
+            pool.setMaxThreadCount(thread_count)
+        for school_code in missing_codes:
+            runnable = PluginUpdateCheckRunnable(self.plugin_manager, school_code)
+            runnable.signals.update_ready.connect(self.on_plugin_update_ready)
+            self._pending_update_checks[school_code] = runnable
+            pool.start(runnable)
+    
+    def on_plugin_update_ready(self, school_code, latest_version, contributor):
+        """单个插件更新检查完成后更新对应行"""
+        self._pending_update_checks.pop(school_code, None)
+        self._set_row_latest_info(school_code, latest_version, contributor)
+        if not self._pending_update_checks:
+            self._finish_update_check()
+    
+    def _set_row_latest_info(self, school_code, latest_version, contributor):
+        """更新表格中某个插件的最新版本和贡献者列"""
+        # 每个插件调用一次，使用惰性格式化
+        logger.info("插件 %s 最新版本: %s", school_code, latest_version)
+        self.plugin_model.update_plugin(school_code, {'latest_version': latest_version, 'contributor': contributor})
+    
+    def _finish_update_check(self):
+        """所有插件更新检查完成"""
+        self.check_update_btn.setEnabled(True)
+        logger.info("插件更新检查完成（从网络获取数据）")
+        QMessageBox.information(self, '提示', '插件更新检查完成，已从网络更新 plugins_index.json 文件')
     
     def auto_load_plugins(self):
-        """自动加载插件列表"""
+        """自动加载插件列表（在后台线程读取插件索引和已安装插件）"""
+        if self._load_runnable is not None:
+            return
         logger.info("开始自动加载插件列表")
-        try:
-            # 清除插件索引缓存，强制重新获取最新数据
-            logger.debug("清除插件索引缓存")
-            self.plugin_manager.clear_plugins_index_cache()
-            
-            # 获取所有可用插件（从索引文件）
-            all_plugins = {}
-            plugins_index = self.plugin_manager._fetch_plugins_index()
-            if plugins_index and isinstance(plugins_index, dict):
-                plugins_list = plugins_index.get('plugins', [])
-                logger.info(f"从插件索引获取到 {len(plugins_list)} 个插件")
-                for plugin in plugins_list:
-                    school_code = plugin.get('school_code')
-                    school_name = plugin.get('school_name', school_code)
-                    contributor = plugin.get('contributor', 'Unknown')
-                    if school_code:
-                        all_plugins[school_code] = {
-                            'name': school_name,
-                            'contributor': contributor,
-                            'latest_version': plugin.get('plugin_version', '-')
-                        }
-                        logger.debug(f"插件索引中找到: {school_code} - {school_name} - {contributor} - {plugin.get('plugin_version', '-')}")
-            else:
-                logger.warning("无法获取插件索引或插件索引为空")
-            
-            # 同时获取已安装的插件
-            installed_plugins = self.plugin_manager.get_available_plugins()
-            logger.info(f"已安装插件数量: {len(installed_plugins)}")
-            for code, name in installed_plugins.items():
-                logger.debug(f"已安装插件: {code} - {name}")
-                if code not in all_plugins:
-                    all_plugins[code] = {
-                        'name': name,
-                        'contributor': 'Unknown',
-                        'latest_version': '-'  # 本地插件的最新版本需要单独检查
-                    }
-            
-            logger.info(f"合并后插件总数: {len(all_plugins)}")
-            
-            # 存储原始插件数据
-            self.original_plugins_data = []
-            for code, data in all_plugins.items():
-                self.original_plugins_data.append({
-                    'code': code,
-                    'name': data['name'],
-                    'contributor': data['contributor'],
-                    'latest_version': data['latest_version']
-                })
-            
-            # 显示插件列表
-            self.display_plugins(self.original_plugins_data)
-            
-            logger.info("插件列表自动加载完成")
-        except Exception as e:
-            logger.error(f"自动加载插件列表失败: {str(e)}", exc_info=True)
-            QMessageBox.critical(self, '错误', f'自动加载插件列表失败: {str(e)}')
+        self._load_runnable = PluginListRunnable(self.plugin_manager)
+        self._load_runnable.signals.finished.connect(self.on_plugins_loaded)
+        QThreadPool.globalInstance().start(self._load_runnable)
+    
+    def on_plugins_loaded(self, success, error, plugins_data):
+        """插件列表加载完成后在界面线程中填充表格"""
+        self._load_runnable = None
+        if not success:
+            logger.error(f"自动加载插件列表失败: {error}")
+            QMessageBox.critical(self, '错误', f'自动加载插件列表失败: {error}')
+            return
+        
+        # 存储原始插件数据，全部填入表格后按当前搜索条件隐藏不匹配的行
+        self.original_plugins_data = plugins_data
+        self.display_plugins(plugins_data)
+        self.filter_plugins()
+        logger.info("插件列表自动加载完成")
     
     def display_plugins(self, plugins_list):
         """显示插件列表"""
         try:
-            self.plugin_table.setRowCount(len(plugins_list))
-            
-            for row, plugin in enumerate(plugins_list):
-                code = plugin['code']
-                name = plugin['name']
-                contributor = plugin['contributor']
-                latest_version = plugin.get('latest_version', '-')
-                
-                logger.debug(f"填充第 {row} 行: {code} - {name} - {contributor}")
-                
-                # 院校代码
-                code_item = QTableWidgetItem(code)
-                code_item.setFlags(code_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.plugin_table.setItem(row, 0, code_item)
-                
-                # 院校名称
-                name_item = QTableWidgetItem(name)
-                name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.plugin_table.setItem(row, 1, name_item)
-                
-                # 当前版本 - 检查是否已安装
-                current_version = self.plugin_manager._get_local_plugin_version(code)
-                version_display = current_version if current_version != "0.0.0" else "未安装"
-                logger.debug(f"插件 {code} 当前版本: {version_display}")
-                current_ver_item = QTableWidgetItem(version_display)
-                current_ver_item.setFlags(current_ver_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.plugin_table.setItem(row, 2, current_ver_item)
-                
-                # 最新版本 - 从JSON获取的最新版本信息
-                latest_ver_item = QTableWidgetItem(latest_version)
-                latest_ver_item.setFlags(latest_ver_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.plugin_table.setItem(row, 3, latest_ver_item)
-                
-                # 贡献者
-                contributor_item = QTableWidgetItem(contributor)
-                contributor_item.setFlags(contributor_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.plugin_table.setItem(row, 4, contributor_item)
-                
+            # 当前版本已由后台加载任务读取；最新版本为从JSON获取的最新版本信息
+            # 模型直接引用插件数据，整体替换后视图只重置一次
+            self.plugin_model.set_plugins(plugins_list)
         except Exception as e:
             logger.error(f"显示插件列表失败: {str(e)}", exc_info=True)
             QMessageBox.critical(self, '错误', f'显示插件列表失败: {str(e)}')
     
     def filter_plugins(self):
-        """根据搜索条件过滤插件"""
-        import re
+        """根据搜索条件过滤插件（表格已包含全部插件，只切换各行的隐藏状态）"""
         search_text = self.search_input.text().strip()
         if not search_text:
             # 如果搜索框为空，显示所有插件
-            self.display_plugins(self.original_plugins_data)
+            matches = None
         else:
-            # 使用正则表达式进行匹配
-            try:
-                # 编译正则表达式，忽略大小写
-                pattern = re.compile(search_text, re.IGNORECASE)
-                
-                # 根据搜索词过滤插件
-                filtered_plugins = []
-                for plugin in self.original_plugins_data:
-                    # 检查院校代码或院校名称是否匹配正则表达式
-                    if (pattern.search(plugin['code']) or 
-                        pattern.search(plugin['name'])):
-                        filtered_plugins.append(plugin)
-                
-                # 显示过滤后的插件
-                self.display_plugins(filtered_plugins)
-            except re.error:
+            # 使用正则表达式进行匹配（忽略大小写，编译结果按搜索文本缓存）
+            pattern = compile_search_pattern(search_text)
+            if pattern is not None:
+                # 检查院校代码或院校名称是否匹配正则表达式
+                def matches(plugin):
+                    return pattern.search(plugin['code']) or pattern.search(plugin['name'])
+            else:
                 # 如果正则表达式无效，回退到简单的子字符串匹配
                 search_text_lower = search_text.lower()
-                filtered_plugins = []
-                for plugin in self.original_plugins_data:
-                    # 检查院校代码或院校名称是否包含搜索词
-                    if (search_text_lower in plugin['code'].lower() or 
-                        search_text_lower in plugin['name'].lower()):
-                        filtered_plugins.append(plugin)
-                
-                # 显示过滤后的插件
-                self.display_plugins(filtered_plugins)
+                def matches(plugin):
+                    return search_text_lower in plugin['code_lc'] or search_text_lower in plugin['name_lc']
+        
+        # 表格行与原始插件数据一一对应，批量切换隐藏状态后统一重绘
+        table = self.plugin_table
+        table.setUpdatesEnabled(False)
+        try:
+            for row, plugin in enumerate(self.original_plugins_data):
+                table.setRowHidden(row, matches is not None and not matches(plugin))
+        finally:
+            table.setUpdatesEnabled(True)
 
 
 class PluginUpdateWorker(QThread):
@@ -643,4 +608,152 @@ class PluginUpdateWorker(QThread):
                 self.finished.emit(True, f'院校 {self.school_code} 插件已是最新版本')
         except Exception as e:
             logger.error(f"更新插件 {self.school_code} 时发生错误: {str(e)}", exc_info=True)
-            self.finished.emit(False, f'更新过程中发生错误: {str(e)}')
\ No newline at end of file
+            self.finished.emit(False, f'更新过程中发生错误: {str(e)}')
+
+
+class PluginListSignals(QObject):
+    """插件列表后台任务的信号载体（QRunnable 本身不能定义信号）"""
+    finished = Signal(bool, str, object)  # 成功标志、错误信息、结果数据
+
+
+class PluginListRunnable(QRunnable):
+    """在全局线程池中读取插件索引和已安装插件，避免阻塞界面线程"""
+    def __init__(self, plugin_manager):
+        super().__init__()
+        self.plugin_manager = plugin_manager
+        self.signals = PluginListSignals()
+
+    def run(self):
+        try:
+            self.signals.finished.emit(True, "", collect_plugins_data(self.plugin_manager))
+        except Exception as e:
+            logger.error(f"自动加载插件列表失败: {str(e)}", exc_info=True)
+            self.signals.finished.emit(False, str(e), None)
+
+
+class CheckUpdatesRunnable(QRunnable):
+    """在全局线程池中从网络更新插件索引并获取各插件的最新版本"""
+    def __init__(self, plugin_manager):
+        super().__init__()
+        self.plugin_manager = plugin_manager
+        self.signals = PluginListSignals()
+
+    def run(self):
+        try:
+            # 从网络下载最新的plugins_index.json文件
+            if not self.plugin_manager.update_plugins_index():
+                self.signals.finished.emit(False, '无法从网络更新插件索引文件，请检查网络连接', None)
+                return
+            
+            plugins_index = self.plugin_manager._fetch_plugins_index()
+            if not plugins_index or not isinstance(plugins_index, dict):
+                self.signals.finished.emit(False, '无法从更新的JSON获取插件索引，请检查网络连接', None)
+                return
+            
+            latest_info = {
+                plugin['code']: (plugin['latest_version'], plugin['contributor'])
+                for plugin in collect_plugins_data(self.plugin_manager)
+            }
+            self.signals.finished.emit(True, "", latest_info)
+        except Exception as e:
+            logger.error(f"检查更新失败: {str(e)}", exc_info=True)
+            self.signals.finished.emit(False, f'检查更新失败: {str(e)}', None)
+
+
+class PluginUpdateCheckSignals(QObject):
+    """单个插件更新检查任务的信号载体"""
+    update_ready = Signal(str, str, str)  # 院校代码、最新版本、贡献者
+
+
+class PluginUpdateCheckRunnable(QRunnable):
+    """在全局线程池中检查单个插件的更新信息"""
+    def __init__(self, plugin_manager, school_code):
+        super().__init__()
+        self.plugin_manager = plugin_manager
+        self.school_code = school_code
+        self.signals = PluginUpdateCheckSignals()
+
+    def run(self):
+        latest_version, contributor = '-', 'Unknown'
+        try:
+            update_info = self.plugin_manager.check_plugin_update(self.school_code)
+            if update_info:
+                latest_version = update_info.get('remote_version', '-')
+                contributor = update_info.get('contributor', 'Unknown')
+        except Exception as e:
+            logger.error(f"检查插件 {self.school_code} 更新失败: {str(e)}", exc_info=True)
+        self.signals.update_ready.emit(self.school_code, latest_version, contributor)
+
+
+class PluginOperationSignals(QObject):
+    """单个插件安装 / 检查更新任务的信号载体"""
+    finished = Signal(str, bool, str, object)  # 院校代码、成功标志、错误信息、插件信息
+
+
+class InstallPluginRunnable(QRunnable):
+    """在全局线程池中下载并安装单个插件，避免网络请求阻塞界面线程"""
+    def __init__(self, plugin_manager, school_code, plugin_info=None, action='安装'):
+        super().__init__()
+        self.plugin_manager = plugin_manager
+        self.school_code = school_code
+        self.plugin_info = plugin_info
+        self.action = action
+        self.signals = PluginOperationSignals()
+
+    def run(self):
+        try:
+            plugin_info = self.plugin_info
+            if plugin_info is None:
+                # 优先使用更新信息，没有时直接从索引安装
+                plugin_info = self.plugin_manager.check_plugin_update(self.school_code)
+                if not plugin_info:
+                    logger.info(f"未找到 {self.school_code} 的更新信息，尝试直接从索引安装")
+                    plugin_info = self.plugin_manager.get_plugin_info_from_index(self.school_code)
+            if not plugin_info:
+                self.signals.finished.emit(self.school_code, False, "", None)
+                return
+            logger.info(f"开始下载安装插件 {self.school_code}")
+            success = self.plugin_manager.download_and_install_plugin(self.school_code, plugin_info)
+            self.signals.finished.emit(self.school_code, bool(success), "", plugin_info)
+        except Exception as e:
+            logger.error(f"{self.action}插件 {self.school_code} 时发生错误: {str(e)}", exc_info=True)
+            self.signals.finished.emit(self.school_code, False, str(e), None)
+
+
+class SinglePluginCheckRunnable(QRunnable):
+    """在全局线程池中检查单个插件的更新信息"""
+    def __init__(self, plugin_manager, school_code):
+        super().__init__()
+        self.plugin_manager = plugin_manager
+        self.school_code = school_code
+        self.signals = PluginOperationSignals()
+
+    def run(self):
+        try:
+            update_info = self.plugin_manager.check_plugin_update(self.school_code)
+            self.signals.finished.emit(self.school_code, True, "", update_info)
+        except Exception as e:
+            logger.error(f"检查插件 {self.school_code} 更新时发生错误: {str(e)}", exc_info=True)
+            self.signals.finished.emit(self.school_code, False, str(e), None)
+
+
+class UninstallSignals(QObject):
+    """卸载任务的信号载体"""
+    finished = Signal(str, bool, str)  # 院校代码、成功标志、错误信息
+
+
+class UninstallPluginRunnable(QRunnable):
+    """在全局线程池中删除插件目录，避免文件较多时阻塞界面线程"""
+    def __init__(self, school_code, plugin_dir):
+        super().__init__()
+        self.school_code = school_code
+        self.plugin_dir = plugin_dir
+        self.signals = UninstallSignals()
+
+    def run(self):
+        try:
+            shutil.rmtree(self.plugin_dir)
+            self.signals.finished.emit(self.school_code, True, "")
+        except Exception as e:
+            logger.error(f"删除插件目录 {self.plugin_dir} 失败: {str(e)}", exc_info=True)
+            self.signals.finished.emit(self.school_code, False, str(e))
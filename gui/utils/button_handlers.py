@@ -44,7 +44,6 @@ def verify_with_school_password(parent_window):
         bool: 验证是否成功
     """
     from PySide6.QtWidgets import QInputDialog, QMessageBox
-    from core.config_manager import load_config
     
     try:
         # 从配置中获取教务系统用户名和密码
@@ -156,11 +155,11 @@ def handle_export_config_button_clicked(config_window_instance):
         logger.info("Windows 身份验证成功。")
 
         # 2. 验证通过，执行导出逻辑
-        # 选择文件路径并导出
+        # 选择文件路径并导出（预设绝对路径，避免对话框枚举当前工作目录）
         file_path, _ = QFileDialog.getSaveFileName(
             config_window_instance,
             "导出明文配置",
-            "config_plaintext.ini",
+            str(Path.home() / "config_plaintext.ini"),
             "INI Files (*.ini);;All Files (*)"
         )
         
@@ -169,7 +168,6 @@ def handle_export_config_button_clicked(config_window_instance):
             return
 
         # 加载当前加密配置字典
-        from core.config_manager import load_config
         import configparser
         
         current_config = load_config()